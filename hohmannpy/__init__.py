@@ -1,3 +1,16 @@
 from . import astro
 from . import dynamics
 from . import ui
+from .astro.propagation import batch as _batch, kepler as _kepler, universal_variable as _universal_variable
+
+
+def warmup():
+    """
+    Compiles the propagation kernels ahead of time. Every kernel is compiled lazily on its first call, or loaded from
+    Numba's on-disk cache if it was compiled in an earlier session, so calling this is optional; it only moves that
+    one-off cost up front, e.g. out of a timed or interactive section.
+    """
+
+    _kepler._warmup()
+    _universal_variable._warmup()
+    _batch._warmup()
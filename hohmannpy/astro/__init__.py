@@ -4,13 +4,13 @@ Astrodynamics utilities for designing and propagating orbits.
 
 # Propagators.
 from .propagation import (
-    Propagator, KeplerPropagator, UniversalVariablePropagator, CowellPropagator
+    Propagator, KeplerPropagator, UniversalVariablePropagator, CowellPropagator, propagate_many
 )
 
 # Conversions.
 from .conversions import (
     classical_2_equinoctial, classical_2_state, classical_2_state_p, equinoctial_2_classical, equinoctial_2_state,
-    state_2_classical, state_2_classical_p
+    perifocal_2_inertial_dcm, perifocal_2_state, state_2_classical, state_2_classical_p
 )
 
 # Other libraries
@@ -1,40 +1,42 @@
 from __future__ import annotations
 import numpy as np
-from ..dynamics import dcms
 
 
 def classical_2_state(
-        sm_axis: float,
-        eccentricity: float,
-        raan: float,
-        argp: float,
-        inclination: float,
-        true_anomaly: float,
+        sm_axis: float | np.ndarray,
+        eccentricity: float | np.ndarray,
+        raan: float | np.ndarray,
+        argp: float | np.ndarray,
+        inclination: float | np.ndarray,
+        true_anomaly: float | np.ndarray,
         grav_param: float = 3.986004418e14,
 ) -> tuple[np.ndarray, np.ndarray]:
     r"""
     Converts the classical orbital elements (where true anomaly is the fast parameter) into inertial position and
     velocity.
 
-    Forms the position and velocity components from the semi-major axis, eccentricity, and true anomaly. These are
-    then assembled into vectors in a basis fixed to the spacecraft. A 3-3-1-3 rotation sequence via the true anomaly,
-    argument of periapsis, inclination, and then RAAN is used to transform these vectors first to the perifocal and
-    then to the planet-centered inertial basis. These transformations are performed using DCMs generated via
-    :func:`dynamics.euler_2_dcm`.
+    Forms the position and velocity from the semi-major axis, eccentricity, and true anomaly in the perifocal basis.
+    The 3-1-3 rotation sequence via the argument of periapsis, inclination, and then RAAN is then used to transform
+    these vectors to the planet-centered inertial basis. This is split into perifocal_2_inertial_dcm() and
+    perifocal_2_state() which may be called directly when sweeping the true anomaly of a single orbit so that the DCM is
+    only formed once.
+
+    The elements may be passed in as arrays of any mutually broadcastable shape :math:`(...)` to convert many orbits
+    at once, in which case the position and velocity are returned with shape :math:`(..., 3)`.
 
     Parameters
     ----------
-    sm_axis : float
+    sm_axis : float or np.ndarray
         Semi-major axis.
-    eccentricity : float
+    eccentricity : float or np.ndarray
         Eccentricity.
-    raan : float
+    raan : float or np.ndarray
         Right ascension (longitude) of the ascending node.
-    argp: float
+    argp: float or np.ndarray
         Argument of periapsis.
-    inclination : float
+    inclination : float or np.ndarray
         Inclination.
-    true_anomaly : float
+    true_anomaly : float or np.ndarray
         True anomaly.
     grav_param: float
         Gravitational parameter of the central body (defaults to that of the Earth in :math:`\text{m}^3/\text{s}^2`).
@@ -42,38 +44,22 @@ def classical_2_state(
     Returns
     -------
     position: np.ndarray
-        Position of the satellite in planet-centered inertial coordinates.
+        Position of the satellite in planet-centered inertial coordinates, a (..., 3) array.
     velocity: np.ndarray
-        Velocity of the satellite in planet-centered inertial coordinates.
+        Velocity of the satellite in planet-centered inertial coordinates, a (..., 3) array.
 
     See Also
     --------
     :func:`classic_2_state_p` : Alternate version of this function which use the semi-latus rectum instead of
         the semi-major axis. Needed for parabolic orbits where the semi-major axis is infinite.
+    :func:`perifocal_2_inertial_dcm` : Forms the rotation from the perifocal to the planet-centered inertial basis.
+    :func:`perifocal_2_state` : Forms position and velocity from the true anomaly and above rotation.
     """
 
-    # Construct the component's of position and velocity in the satellite's local frame.
     sl_rectum = sm_axis * (1 - eccentricity ** 2)
-    pos_magnitude = sl_rectum / (1 + eccentricity * np.cos(true_anomaly))  # Trajectory eq.
-    pos_magnitude_dt = np.sqrt(grav_param / sl_rectum) * eccentricity * np.sin(true_anomaly)
-    true_anomaly_dt = np.sqrt(grav_param * sl_rectum) / pos_magnitude ** 2
-
-    # Construct the DCM from the local to ecliptic frame.
-    local_2_perifocal_dcm = dcms.euler_2_dcm(true_anomaly, 3).T
-    perifocal_2_inertial_dcm = (
-            dcms.euler_2_dcm(raan, 3).T
-            @ dcms.euler_2_dcm(inclination, 1).T
-            @ dcms.euler_2_dcm(argp, 3).T
-    )
+    dcm = perifocal_2_inertial_dcm(raan, argp, inclination)
 
-    # Compute position and velocity in the local frame and then transform them to the inertial frame.
-    position = np.array([pos_magnitude, 0, 0])
-    velocity = np.array([pos_magnitude_dt, pos_magnitude * true_anomaly_dt, 0])
-
-    position = perifocal_2_inertial_dcm @ local_2_perifocal_dcm @ position
-    velocity = perifocal_2_inertial_dcm @ local_2_perifocal_dcm @ velocity
-
-    return position, velocity
+    return perifocal_2_state(sl_rectum, eccentricity, true_anomaly, dcm, grav_param)
 
 def state_2_classical(
         position: np.ndarray,
@@ -122,11 +108,6 @@ def state_2_classical(
         instead of the semi-major axis. Useful for parabolic orbits where the semi-major axis is infinite.
     """
 
-    # Define unit vectors.
-    unit_vec_1 = np.array([1, 0, 0])
-    unit_vec_2 = np.array([0, 1, 0])
-    unit_vec_3 = np.array([0, 0, 1])
-
     # Compute the eccentricity vector and from that the eccentricity.
     spf_angular_momentum = np.cross(position, velocity)
     eccentricity_vec = (
@@ -134,20 +115,19 @@ def state_2_classical(
             / grav_param - position / np.linalg.norm(position)
     )
     eccentricity = np.linalg.norm(eccentricity_vec)
-    nodal_vec = np.cross(unit_vec_3, spf_angular_momentum)
+    # Cross-product of the 3-axis with h. 0 - h_2 keeps the +0 np.cross() gives for equatorial orbits, -0 would put the
+    # raan at pi.
+    nodal_vec = np.array([0.0 - spf_angular_momentum[1], spf_angular_momentum[0], 0.0])
 
     # Compute the semi-major axis.
     sl_rectum = np.linalg.norm(spf_angular_momentum) ** 2 / grav_param
     sm_axis = sl_rectum / (1 - eccentricity ** 2)
 
     # Compute all the angles needed to parameterize an orbit.
-    raan = np.arctan2(
-        np.dot(nodal_vec, unit_vec_2),
-        np.dot(nodal_vec, unit_vec_1)
-    )
-    inclination = np.arctan2(
-        np.dot(spf_angular_momentum, np.cross(nodal_vec, unit_vec_3)),
-        np.linalg.norm(nodal_vec) * np.dot(spf_angular_momentum, unit_vec_3)
+    raan = np.arctan2(nodal_vec[1], nodal_vec[0])
+    inclination = np.arctan2(  # Cross-product of the nodal vector with the 3-axis is [n_2, -n_1, 0].
+        spf_angular_momentum[0] * nodal_vec[1] - spf_angular_momentum[1] * nodal_vec[0],
+        np.linalg.norm(nodal_vec) * spf_angular_momentum[2]
     )
     argp = np.arctan2(
         np.dot(eccentricity_vec, np.cross(spf_angular_momentum, nodal_vec)),
@@ -169,12 +149,12 @@ def state_2_classical(
     return sm_axis, eccentricity, raan, inclination, argp, true_anomaly
 
 def classical_2_state_p(
-        sl_rectum: float,
-        eccentricity: float,
-        raan: float,
-        argp: float,
-        inclination: float,
-        true_anomaly: float,
+        sl_rectum: float | np.ndarray,
+        eccentricity: float | np.ndarray,
+        raan: float | np.ndarray,
+        argp: float | np.ndarray,
+        inclination: float | np.ndarray,
+        true_anomaly: float | np.ndarray,
         grav_param: float = 3.986004418e14,
 ):
     r"""
@@ -187,17 +167,17 @@ def classical_2_state_p(
 
     Parameters
     ----------
-    sl_rectum : float
+    sl_rectum : float or np.ndarray
         Semi-latus rectum.
-    eccentricity : float
+    eccentricity : float or np.ndarray
         Eccentricity.
-    raan : float
+    raan : float or np.ndarray
         Right ascension (longitude) of the ascending node.
-    argp: float
+    argp: float or np.ndarray
         Argument of periapsis.
-    inclination : float
+    inclination : float or np.ndarray
         Inclination.
-    true_anomaly : float
+    true_anomaly : float or np.ndarray
         True anomaly.
     grav_param: float
         Gravitational parameter of the central body (defaults to that of the Earth in :math:`\text{m}^3/\text{s}^2`).
@@ -205,9 +185,9 @@ def classical_2_state_p(
     Returns
     -------
     position: np.ndarray
-        Position of the satellite in planet-centered inertial coordinates.
+        Position of the satellite in planet-centered inertial coordinates, a (..., 3) array.
     velocity: np.ndarray
-        Velocity of the satellite in planet-centered inertial coordinates.
+        Velocity of the satellite in planet-centered inertial coordinates, a (..., 3) array.
 
     See Also
     --------
@@ -226,27 +206,9 @@ def classical_2_state_p(
     can not be recovered.
     """
 
-    # Construct the component's of position and velocity in the satellite's local frame.
-    pos_magnitude = sl_rectum / (1 + eccentricity * np.cos(true_anomaly))  # Trajectory eq.
-    pos_magnitude_dt = np.sqrt(grav_param / sl_rectum) * eccentricity * np.sin(true_anomaly)
-    true_anomaly_dt = np.sqrt(grav_param * sl_rectum) / pos_magnitude ** 2
-
-    # Construct the DCM from the local to ecliptic frame.
-    local_2_perifocal_dcm = dcms.euler_2_dcm(true_anomaly, 3).T
-    perifocal_2_inertial_dcm = (
-            dcms.euler_2_dcm(raan, 3).T
-            @ dcms.euler_2_dcm(inclination, 1).T
-            @ dcms.euler_2_dcm(argp, 3).T
-    )
-
-    # Compute position and velocity in the local frame and then transform them to the inertial frame.
-    position = np.array([pos_magnitude, 0, 0])
-    velocity = np.array([pos_magnitude_dt, pos_magnitude * true_anomaly_dt, 0])
-
-    position = perifocal_2_inertial_dcm @ local_2_perifocal_dcm @ position
-    velocity = perifocal_2_inertial_dcm @ local_2_perifocal_dcm @ velocity
+    dcm = perifocal_2_inertial_dcm(raan, argp, inclination)
 
-    return position, velocity
+    return perifocal_2_state(sl_rectum, eccentricity, true_anomaly, dcm, grav_param)
 
 def state_2_classical_p(
         position: np.ndarray,
@@ -304,11 +266,6 @@ def state_2_classical_p(
     can not be recovered.
     """
 
-    # Define unit vectors.
-    unit_vec_1 = np.array([1, 0, 0])
-    unit_vec_2 = np.array([0, 1, 0])
-    unit_vec_3 = np.array([0, 0, 1])
-
     # Compute the eccentricity vector and from that the eccentricity.
     spf_angular_momentum = np.cross(position, velocity)
     eccentricity_vec = (
@@ -316,19 +273,18 @@ def state_2_classical_p(
             / grav_param - position / np.linalg.norm(position)
     )
     eccentricity = np.linalg.norm(eccentricity_vec)
-    nodal_vec = np.cross(unit_vec_3, spf_angular_momentum)
+    # Cross-product of the 3-axis with h. 0 - h_2 keeps the +0 np.cross() gives for equatorial orbits, -0 would put the
+    # raan at pi.
+    nodal_vec = np.array([0.0 - spf_angular_momentum[1], spf_angular_momentum[0], 0.0])
 
     # Compute the semi-major axis.
     sl_rectum = np.linalg.norm(spf_angular_momentum) ** 2 / grav_param
 
     # Compute all the angles needed to parameterize an orbit.
-    raan = np.arctan2(
-        np.dot(nodal_vec, unit_vec_2),
-        np.dot(nodal_vec, unit_vec_1)
-    )
-    inclination = np.arctan2(
-        np.dot(spf_angular_momentum, np.cross(nodal_vec, unit_vec_3)),
-        np.linalg.norm(nodal_vec) * np.dot(spf_angular_momentum, unit_vec_3)
+    raan = np.arctan2(nodal_vec[1], nodal_vec[0])
+    inclination = np.arctan2(  # Cross-product of the nodal vector with the 3-axis is [n_2, -n_1, 0].
+        spf_angular_momentum[0] * nodal_vec[1] - spf_angular_momentum[1] * nodal_vec[0],
+        np.linalg.norm(nodal_vec) * spf_angular_momentum[2]
     )
     argp = np.arctan2(
         np.dot(eccentricity_vec, np.cross(spf_angular_momentum, nodal_vec)),
@@ -350,31 +306,34 @@ def state_2_classical_p(
     return sl_rectum, eccentricity, raan, inclination, argp, true_anomaly
 
 def equinoctial_2_state(
-        sl_rectum: float,
-        e_component1: float,
-        e_component2: float,
-        n_component1: float,
-        n_component2: float,
-        true_latitude: float,
+        sl_rectum: float | np.ndarray,
+        e_component1: float | np.ndarray,
+        e_component2: float | np.ndarray,
+        n_component1: float | np.ndarray,
+        n_component2: float | np.ndarray,
+        true_latitude: float | np.ndarray,
         grav_param: float = 3.986004418e14
 ) -> tuple[np.ndarray, np.ndarray]:
     r"""
     Converts the modified equinoctial orbital elements (where true latitude is the fast parameter) into inertial
     position and velocity.
 
+    The elements may be passed in as arrays of any mutually broadcastable shape :math:`(...)` to convert many orbits
+    at once, in which case the position and velocity are returned with shape :math:`(..., 3)`.
+
     Parameters
     ----------
-    sl_rectum : float
+    sl_rectum : float or np.ndarray
         Semi-latus rectum.
-    e_component1 : float
+    e_component1 : float or np.ndarray
         x-component of the eccentricity vector in the planet-centered inertial basis.
-    e_component2 : float
+    e_component2 : float or np.ndarray
         y-component of the eccentricity vector in the planet-centered inertial basis.
-    n_component1 : float
+    n_component1 : float or np.ndarray
         x-component of the nodal vector in the planet-centered inertial basis.
-    n_component2 : float
+    n_component2 : float or np.ndarray
         y-component of the nodal vector in the planet-centered inertial basis.
-    true_latitude : float
+    true_latitude : float or np.ndarray
         True latitude.
     grav_param: float
         Gravitational parameter of the central body (defaults to that of the Earth in :math:`\text{m}^3/\text{s}^2`).
@@ -382,66 +341,72 @@ def equinoctial_2_state(
     Returns
     -------
     position: np.ndarray
-        Position of the satellite in planet-centered inertial coordinates.
+        Position of the satellite in planet-centered inertial coordinates, a (..., 3) array.
     velocity: np.ndarray
-        Velocity of the satellite in planet-centered inertial coordinates.
+        Velocity of the satellite in planet-centered inertial coordinates, a (..., 3) array.
     """
 
     # Intermediate variables.
+    cos_true_latitude = np.cos(true_latitude)
+    sin_true_latitude = np.sin(true_latitude)
     var1 = n_component1 ** 2 - n_component2 ** 2  # alpha
     var2 = 1 + n_component1 ** 2 + n_component2 ** 2  # s
-    var3 = 1 + e_component1 * np.cos(true_latitude) + e_component2 * np.sin(true_latitude)  # w
+    var3 = 1 + e_component1 * cos_true_latitude + e_component2 * sin_true_latitude  # w
     var4 = sl_rectum / var3  # r
 
-    # Construct position and velocity.
-    position = var4 / var2 *  np.array([
-        np.cos(true_latitude)
-            + var1 * np.cos(true_latitude)
-            + 2 * n_component1 * n_component2 * np.sin(true_latitude),
-        np.sin(true_latitude)
-            - var1 * np.sin(true_latitude)
-            + 2 * n_component1 * n_component2 * np.cos(true_latitude),
-        2 * (n_component1 * np.sin(true_latitude) - n_component2 * np.cos(true_latitude))
-    ])
-    velocity = -1 / var2 * np.sqrt(grav_param / sl_rectum) * np.array([
-        np.sin(true_latitude) + var1 * np.sin(true_latitude)
-            - 2 * n_component1 * n_component2 * np.cos(true_latitude)
+    # Construct position and velocity. The scale factors gain a trailing axis to broadcast against the (..., 3)
+    # direction vectors.
+    position = np.expand_dims(var4 / var2, -1) * np.stack(np.broadcast_arrays(
+        cos_true_latitude
+            + var1 * cos_true_latitude
+            + 2 * n_component1 * n_component2 * sin_true_latitude,
+        sin_true_latitude
+            - var1 * sin_true_latitude
+            + 2 * n_component1 * n_component2 * cos_true_latitude,
+        2 * (n_component1 * sin_true_latitude - n_component2 * cos_true_latitude)
+    ), axis=-1)
+    velocity = np.expand_dims(-1 / var2 * np.sqrt(grav_param / sl_rectum), -1) * np.stack(np.broadcast_arrays(
+        sin_true_latitude + var1 * sin_true_latitude
+            - 2 * n_component1 * n_component2 * cos_true_latitude
             + e_component2 - 2 * e_component1 * n_component1 * n_component2
             + var1 * e_component2,
-        -np.cos(true_latitude) + var1 * np.cos(true_latitude)
-            + 2 * n_component1 * n_component2 * np.sin(true_latitude)
+        -cos_true_latitude + var1 * cos_true_latitude
+            + 2 * n_component1 * n_component2 * sin_true_latitude
             - e_component1 + 2 * e_component2 * n_component1 * n_component2
             + var1 * e_component1,
-        -2 * (n_component1 * np.cos(true_latitude) + n_component2 * np.sin(true_latitude)
+        -2 * (n_component1 * cos_true_latitude + n_component2 * sin_true_latitude
               + e_component1 * n_component1 + e_component2 * n_component2)
-    ])
+    ), axis=-1)
 
     return position, velocity
 
 def classical_2_equinoctial(
-        sm_axis: float,
-        eccentricity: float,
-        raan: float,
-        argp: float,
-        inclination: float,
-        true_anomaly: float,
+        sm_axis: float | np.ndarray,
+        eccentricity: float | np.ndarray,
+        raan: float | np.ndarray,
+        argp: float | np.ndarray,
+        inclination: float | np.ndarray,
+        true_anomaly: float | np.ndarray,
 ) -> tuple[float, float, float, float, float, float]:
     """
     Converts the classical orbital elements into the modified equinoctial orbital elements.
 
+    Works elementwise, so the elements may also be passed in as arrays of any mutually broadcastable shape to convert
+    many orbits at once.
+
     Parameters
     ----------
-    sm_axis : float
+    sm_axis : float or np.ndarray
         Semi-major axis.
-    eccentricity : float
+    eccentricity : float or np.ndarray
         Eccentricity.
-    raan : float
+    raan : float or np.ndarray
         Right ascension (longitude) of the ascending node.
-    argp: float
+    argp: float or np.ndarray
         Argument of periapsis.
-    inclination : float
+    inclination : float or np.ndarray
         Inclination.
-    true_anomaly : float
+    true_anomaly : float or np.ndarray
         True anomaly.
 
     Returns
@@ -465,39 +430,45 @@ def classical_2_equinoctial(
     semi-latus rectum will be NAN but all other parameters will be correct.
     """
 
+    longp = argp + raan  # Longitude of periapsis.
+    tan_half_inclination = np.tan(inclination / 2)
+
     sl_rectum = sm_axis * (1 - eccentricity ** 2)
-    e_component1 = eccentricity * np.cos(argp + raan)
-    e_component2 = eccentricity * np.sin(argp + raan)
-    n_component1 = np.tan(inclination / 2) * np.cos(raan)
-    n_component2 = np.tan(inclination / 2) * np.sin(raan)
-    true_latitude = raan + argp + true_anomaly
+    e_component1 = eccentricity * np.cos(longp)
+    e_component2 = eccentricity * np.sin(longp)
+    n_component1 = tan_half_inclination * np.cos(raan)
+    n_component2 = tan_half_inclination * np.sin(raan)
+    true_latitude = longp + true_anomaly
 
     return sl_rectum, e_component1, e_component2, n_component1, n_component2, true_latitude
 
 def equinoctial_2_classical(
-        sl_rectum: float,
-        e_component1: float,
-        e_component2: float,
-        n_component1: float,
-        n_component2: float,
-        true_latitude: float,
+        sl_rectum: float | np.ndarray,
+        e_component1: float | np.ndarray,
+        e_component2: float | np.ndarray,
+        n_component1: float | np.ndarray,
+        n_component2: float | np.ndarray,
+        true_latitude: float | np.ndarray,
 ) -> tuple[float, float, float, float, float, float]:
     """
     Converts the modified equinoctial orbital elements to the classical orbital elements.
 
+    Works elementwise, so the elements may also be passed in as arrays of any mutually broadcastable shape to convert
+    many orbits at once.
+
     Parameters
     ----------
-    sl_rectum : float
+    sl_rectum : float or np.ndarray
         Semi-latus rectum.
-    e_component1 : float
+    e_component1 : float or np.ndarray
         x-component of the eccentricity vector in the planet-centered inertial basis.
-    e_component2 : float
+    e_component2 : float or np.ndarray
         y-component of the eccentricity vector in the planet-centered inertial basis.
-    n_component1 : float
+    n_component1 : float or np.ndarray
         x-component of the nodal vector in the planet-centered inertial basis.
-    n_component2 : float
+    n_component2 : float or np.ndarray
         y-component of the nodal vector in the planet-centered inertial basis.
-    true_latitude : float
+    true_latitude : float or np.ndarray
         True latitude.
 
     Returns
@@ -516,11 +487,14 @@ def equinoctial_2_classical(
         True anomaly.
     """
 
-    sm_axis = sl_rectum / (1 - e_component1 ** 2 - e_component2 ** 2)
-    eccentricity = np.sqrt(e_component1 ** 2 + e_component2 ** 2)
+    eccentricity_sq = e_component1 ** 2 + e_component2 ** 2
+    tan_half_inclination_sq = n_component1 ** 2 + n_component2 ** 2
+
+    sm_axis = sl_rectum / (1 - eccentricity_sq)
+    eccentricity = np.sqrt(eccentricity_sq)
     inclination = np.arctan2(
-        2 * np.sqrt(n_component1 ** 2 + n_component2 ** 2),
-        1 - n_component1 ** 2 - n_component2 ** 2
+        2 * np.sqrt(tan_half_inclination_sq),
+        1 - tan_half_inclination_sq
     )
     argp = np.arctan2(
         e_component2 * n_component1 - e_component1 * n_component2,
@@ -530,3 +504,119 @@ def equinoctial_2_classical(
     true_anomaly = true_latitude - np.arctan2(e_component2, e_component1)
 
     return sm_axis, eccentricity, raan, argp, inclination, true_anomaly
+
+def perifocal_2_inertial_dcm(
+        raan: float | np.ndarray,
+        argp: float | np.ndarray,
+        inclination: float | np.ndarray,
+) -> np.ndarray:
+    r"""
+    Forms the DCM which rotates vectors from the perifocal basis to the planet-centered inertial basis.
+
+    This is the 3-1-3 rotation sequence via the argument of periapsis, inclination, and then RAAN multiplied out in
+    closed form. Its columns are the inertial components of the perifocal basis vectors, pointing towards periapsis,
+    along the semi-latus rectum, and along the angular momentum respectively. None of these depend on the true anomaly
+    so the DCM may be formed once and reused for every point along an unperturbed orbit.
+
+    The angles may be passed in as arrays of any mutually broadcastable shape :math:`(...)`, in which case a DCM is
+    returned for each with shape :math:`(..., 3, 3)`.
+
+    Parameters
+    ----------
+    raan : float or np.ndarray
+        Right ascension (longitude) of the ascending node.
+    argp: float or np.ndarray
+        Argument of periapsis.
+    inclination : float or np.ndarray
+        Inclination.
+
+    Returns
+    -------
+    dcm : np.ndarray
+        Perifocal to planet-centered inertial DCM, a (..., 3, 3) array.
+    """
+
+    cos_raan = np.cos(raan)
+    sin_raan = np.sin(raan)
+    cos_argp = np.cos(argp)
+    sin_argp = np.sin(argp)
+    cos_inclination = np.cos(inclination)
+    sin_inclination = np.sin(inclination)
+
+    entries = np.broadcast_arrays(
+        cos_raan * cos_argp - sin_raan * sin_argp * cos_inclination,
+        -cos_raan * sin_argp - sin_raan * cos_argp * cos_inclination,
+        sin_raan * sin_inclination,
+        sin_raan * cos_argp + cos_raan * sin_argp * cos_inclination,
+        -sin_raan * sin_argp + cos_raan * cos_argp * cos_inclination,
+        -cos_raan * sin_inclination,
+        sin_argp * sin_inclination,
+        cos_argp * sin_inclination,
+        cos_inclination
+    )
+    dcm = np.stack(entries, axis=-1).reshape(entries[0].shape + (3, 3))
+
+    return dcm
+
+def perifocal_2_state(
+        sl_rectum: float | np.ndarray,
+        eccentricity: float | np.ndarray,
+        true_anomaly: float | np.ndarray,
+        dcm: np.ndarray,
+        grav_param: float = 3.986004418e14,
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""
+    Converts the true anomaly into inertial position and velocity given the shape of the orbit and the perifocal to
+    planet-centered inertial DCM.
+
+    The position and velocity are formed in the perifocal basis, where both lie in the orbital plane, and then
+    rotated using the first two columns of the DCM. This is the lower-level half of classical_2_state(). When sweeping
+    the true anomaly along one orbit the DCM from perifocal_2_inertial_dcm() can be formed once and an array of true
+    anomalies passed in here to get the whole trajectory at once.
+
+    The true anomaly and orbit shape may be arrays of any mutually broadcastable shape :math:`(...)` and the DCM a
+    (..., 3, 3) array broadcastable against these. The position and velocity are returned with shape :math:`(..., 3)`.
+
+    Parameters
+    ----------
+    sl_rectum : float or np.ndarray
+        Semi-latus rectum.
+    eccentricity : float or np.ndarray
+        Eccentricity.
+    true_anomaly : float or np.ndarray
+        True anomaly.
+    dcm : np.ndarray
+        Perifocal to planet-centered inertial DCM, a (..., 3, 3) array.
+    grav_param: float
+        Gravitational parameter of the central body (defaults to that of the Earth in :math:`\text{m}^3/\text{s}^2`).
+
+    Returns
+    -------
+    position: np.ndarray
+        Position of the satellite in planet-centered inertial coordinates, a (..., 3) array.
+    velocity: np.ndarray
+        Velocity of the satellite in planet-centered inertial coordinates, a (..., 3) array.
+
+    See Also
+    --------
+    :func:`perifocal_2_inertial_dcm` : Forms the DCM passed in here.
+    """
+
+    # Construct the components of position and velocity in the perifocal basis. The out-of-plane components are zero.
+    cos_true_anomaly = np.cos(true_anomaly)
+    sin_true_anomaly = np.sin(true_anomaly)
+    pos_magnitude = sl_rectum / (1 + eccentricity * cos_true_anomaly)  # Trajectory eq.
+    vel_scale = np.sqrt(grav_param / sl_rectum)
+    position_p = np.expand_dims(pos_magnitude * cos_true_anomaly, -1)
+    position_q = np.expand_dims(pos_magnitude * sin_true_anomaly, -1)
+    velocity_p = np.expand_dims(-vel_scale * sin_true_anomaly, -1)
+    velocity_q = np.expand_dims(vel_scale * (eccentricity + cos_true_anomaly), -1)
+
+    # Rotate to the inertial frame. Only the in-plane perifocal basis vectors (the first two columns of the DCM) are
+    # needed, each gaining the components above on a trailing axis.
+    periapsis_dir = dcm[..., :, 0]
+    sl_rectum_dir = dcm[..., :, 1]
+    position = position_p * periapsis_dir + position_q * sl_rectum_dir
+    velocity = velocity_p * periapsis_dir + velocity_q * sl_rectum_dir
+
+    return position, velocity
@@ -21,9 +21,12 @@ class Logger(ABC):
         Equivalent to an __init__() but the former is not used because we want to be able to pass a Logger into a
         Propagator during the latter's __init__(). All child classes must implement this method with the following
         steps:
-            1) Allocate space using np.zeros() where the data is stored column-wise with N columns where N = the number
-               of timesteps stored in the Propagator's timestep attribute.
-            2) Fill in the 0th column of each array with the orbit's initial values for the stored data.
+            1) Allocate space using np.empty() (every entry is written, either in step 2 or by log()) where the data is
+               stored column-wise with N columns where N = the number of timesteps stored in the Propagator's timestep
+               attribute. The exception is vector data which is stored row-wise as (N, 3) arrays so that each
+               timestep's vector is contiguous in memory. Arrays use the Propagator's dtype attribute, except for time
+               histories which always stay in double precision since epochs are large numbers.
+            2) Fill in the 0th column (or row) of each array with the orbit's initial values for the stored data.
 
         NOTE: Can't call this till after the initial values of Propagator-specific attributes, such as eccentric_anomaly
         for KeplerPropagator, have been set. This is typically towards the start of a Propagator's propagate() method.
@@ -36,8 +39,8 @@ class Logger(ABC):
     @abstractmethod
     def log(self, propagator: propagation.base.Propagator, timestep: int):
         """
-        Fill in the Nth column of each history array with the orbit's current values for each data. The data is accessed
-        by calling propagator.orbit.
+        Fill in the Nth column (or row) of each history array with the orbit's current values for each data. The data
+        is accessed by calling propagator.orbit.
 
         :param propagator: Propagator object which contains the Orbit object to receive data from.
         :param timestep: How many timesteps propagation has occurred for.
@@ -48,7 +51,8 @@ class Logger(ABC):
 
 class StateLogger(Logger):
     """
-    Logs the time and Cartesian state (position and velocity) of the orbit.
+    Logs the time and Cartesian state (position and velocity) of the orbit. The position and velocity histories are
+    (N, 3) arrays with one row per timestep, use .T for a (3, N) view.
     """
     def __init__(self):
         self.position_history = None
@@ -57,17 +61,17 @@ class StateLogger(Logger):
         super().__init__()
 
     def setup(self, propagator: propagation.base.Propagator):
-        self.position_history = np.zeros([3, propagator.timesteps + 1])
-        self.velocity_history = np.zeros([3, propagator.timesteps + 1])
-        self.time_history = np.zeros([1, propagator.timesteps + 1])
+        self.position_history = np.empty([propagator.timesteps + 1, 3], dtype=propagator.dtype)
+        self.velocity_history = np.empty([propagator.timesteps + 1, 3], dtype=propagator.dtype)
+        self.time_history = np.empty([1, propagator.timesteps + 1])
 
-        self.position_history[:, 0] = propagator.orbit.position
-        self.velocity_history[:, 0] = propagator.orbit.velocity
+        self.position_history[0] = propagator.orbit.position
+        self.velocity_history[0] = propagator.orbit.velocity
         self.time_history[0, 0] = propagator.orbit.time
 
     def log(self, propagator: propagation.base.Propagator, timestep: int):
-        self.position_history[:, timestep] = propagator.orbit.position
-        self.velocity_history[:, timestep] = propagator.orbit.velocity
+        self.position_history[timestep] = propagator.orbit.position
+        self.velocity_history[timestep] = propagator.orbit.velocity
         self.time_history[0, timestep] = propagator.orbit.time
 
 
@@ -93,15 +97,15 @@ class ElementsLogger(Logger):
         super().__init__()
 
     def setup(self, propagator: propagation.base.Propagator):
-        self.sm_axis_history = np.zeros([1, propagator.timesteps + 1])
-        self.eccentricity_history = np.zeros([1, propagator.timesteps + 1])
-        self.inclination_history = np.zeros([1, propagator.timesteps + 1])
-        self.raan_history = np.zeros([1, propagator.timesteps + 1])
-        self.argp_history = np.zeros([1, propagator.timesteps + 1])
-        self.true_anomaly_history = np.zeros([1, propagator.timesteps + 1])
-        self.longp_history = np.zeros([1, propagator.timesteps + 1])
-        self.argl_history = np.zeros([1, propagator.timesteps + 1])
-        self.true_latitude_history = np.zeros([1, propagator.timesteps + 1])
+        self.sm_axis_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.eccentricity_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.inclination_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.raan_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.argp_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.true_anomaly_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.longp_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.argl_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.true_latitude_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
 
         self.sm_axis_history[0, 0] = propagator.orbit.sm_axis
         self.eccentricity_history[0, 0] = propagator.orbit.eccentricity
@@ -114,10 +118,10 @@ class ElementsLogger(Logger):
         self.true_latitude_history[0, 0] = propagator.orbit.true_latitude
 
         if propagator.orbit.track_equinoctial:
-            self.e_component1_history = np.zeros([1, propagator.timesteps + 1])
-            self.e_component2_history = np.zeros([1, propagator.timesteps + 1])
-            self.n_component1_history = np.zeros([1, propagator.timesteps + 1])
-            self.n_component2_history = np.zeros([1, propagator.timesteps + 1])
+            self.e_component1_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+            self.e_component2_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+            self.n_component1_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+            self.n_component2_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
 
             self.e_component1_history[0, 0] = propagator.orbit.e_component1
             self.e_component2_history[0, 0] = propagator.orbit.e_component2
@@ -151,7 +155,7 @@ class EccentricAnomalyLogger(Logger):
         super().__init__()
 
     def setup(self, propagator: propagation.kepler.KeplerPropagator):
-        self.eccentric_anomaly_history = np.zeros([1, propagator.timesteps + 1])
+        self.eccentric_anomaly_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
 
         self.eccentric_anomaly_history[0, 0] = propagator.eccentric_anomaly
 
@@ -170,8 +174,8 @@ class UniversalVariableLogger(Logger):
         super().__init__()
 
     def setup(self, propagator: propagation.universal_variable.UniversalVariablePropagator):
-        self.universal_variable_history = np.zeros([1, propagator.timesteps + 1])
-        self.stumpff_param_history = np.zeros([1, propagator.timesteps + 1])
+        self.universal_variable_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
+        self.stumpff_param_history = np.empty([1, propagator.timesteps + 1], dtype=propagator.dtype)
 
         self.universal_variable_history[0, 0] = propagator.universal_variable
         self.stumpff_param_history[0, 0] = propagator.stumpff_param
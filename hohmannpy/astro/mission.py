@@ -86,14 +86,10 @@ class Mission:
 
         # TODO: Error handling for missing a state logger.
         for logger in self.propagator.loggers:
-            if isinstance(logger, propagation.logging.StateLogger):
-                times_to_log = logger.time_history.copy()
-                positions_to_log = logger.position_history.copy()
-                velocities_to_log = logger.velocity_history.copy()
-
-                times_to_log = times_to_log.T
-                positions_to_log = positions_to_log.T
-                velocities_to_log = velocities_to_log.T
+            if isinstance(logger, logging.StateLogger):
+                times_to_log = logger.time_history.T
+                positions_to_log = logger.position_history
+                velocities_to_log = logger.velocity_history
 
                 labels = ['time', 'x-position', 'y-position', 'z-position', 'x-velocity', 'y-velocity', 'z-velocity']
                 data_arr = np.hstack((times_to_log, positions_to_log, velocities_to_log))
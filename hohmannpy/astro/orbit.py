@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import math
 import numpy as np
 from numpy.typing import NDArray
 from . import propagation, conversions
-import scipy as sp
 
 
 class Orbit:
@@ -49,6 +49,21 @@ class Orbit:
         orbital elements.
     """
 
+    # Attributes are stored in fixed slots rather than a per-instance __dict__ since propagators read and write them on
+    # every timestep.
+    __slots__ = (
+        # Base parameters.
+        "position", "velocity", "time", "grav_param",
+        # Classical orbital elements.
+        "sm_axis", "eccentricity", "raan", "argp", "inclination", "true_anomaly",
+        # Modified equinoctial orbital elements.
+        "sl_rectum", "e_component1", "e_component2", "n_component1", "n_component2", "true_latitude",
+        # Other orbital parameters.
+        "longp", "argl", "spf_angular_momentum", "eccentricity_vec", "nodal_vec",
+        # Bookkeeping.
+        "track_equinoctial",
+    )
+
     def __init__(
             self,
             position: NDArray[float],
@@ -158,7 +173,7 @@ class Orbit:
         semi-latus rectum is used instead.
         """
 
-        position, velocity = conversions.classic_elements_2_state_p(
+        position, velocity = conversions.classical_2_state_p(
             sl_rectum=sl_rectum,
             eccentricity=eccentricity,
             raan=raan,
@@ -211,6 +226,7 @@ class Orbit:
             n_component1=n_component1,
             n_component2=n_component2,
             true_latitude=true_latitude,
+            grav_param=grav_param,
         )
         orbit = cls(position, velocity, grav_param, track_equinoctial, _default=False)
 
@@ -268,15 +284,15 @@ class Orbit:
         # Form the three vectors used in Gibbs' method. The first two correspond to sl_rectum = vec1 / vec2, and the
         # third comes from eccentricity = vec3 / vec2 in the derivation.
         gibbs_vec1 = (
-                np.linalg.norm(position3) * np.cross(position1, position2)
-                    + np.linalg.norm(position1) * np.cross(position2, position3)
-                    + np.linalg.norm(position2) * np.cross(position3, position1)
+                _norm3(position3) * _cross3(position1, position2)
+                    + _norm3(position1) * _cross3(position2, position3)
+                    + _norm3(position2) * _cross3(position3, position1)
         )
-        gibbs_vec2 = np.cross(position1, position2) + np.cross(position2, position3) + np.cross(position3, position1)
+        gibbs_vec2 = _cross3(position1, position2) + _cross3(position2, position3) + _cross3(position3, position1)
         gibbs_vec3 = (
-                (np.linalg.norm(position2) - np.linalg.norm(position3)) * position1
-                    + (np.linalg.norm(position3) - np.linalg.norm(position1)) * position2
-                    + (np.linalg.norm(position1) - np.linalg.norm(position2)) * position3
+                (_norm3(position2) - _norm3(position3)) * position1
+                    + (_norm3(position3) - _norm3(position1)) * position2
+                    + (_norm3(position1) - _norm3(position2)) * position3
         )
 
         # Compute the velocity corresponding to current position.
@@ -288,10 +304,10 @@ class Orbit:
             case 3:
                 position = position3
         velocity = (
-                1 / np.linalg.norm(position)
-                    * np.sqrt(grav_param / (np.linalg.norm(gibbs_vec1) * np.linalg.norm(gibbs_vec2)))
-                    * np.cross(gibbs_vec2, position)
-                    + np.sqrt(grav_param / (np.linalg.norm(gibbs_vec1) * np.linalg.norm(gibbs_vec2))) * gibbs_vec3
+                1 / _norm3(position)
+                    * np.sqrt(grav_param / (_norm3(gibbs_vec1) * _norm3(gibbs_vec2)))
+                    * _cross3(gibbs_vec2, position)
+                    + np.sqrt(grav_param / (_norm3(gibbs_vec1) * _norm3(gibbs_vec2))) * gibbs_vec3
         )
 
         return cls(position, velocity, grav_param, track_equinoctial)
@@ -345,10 +361,16 @@ class Orbit:
         :param track_equinoctial:
         """
 
+        # Quantities which are invariant while solving Lambert's problem.
+        radius1 = _norm3(position1)
+        radius2 = _norm3(position2)
+        sqrt_grav_param = math.sqrt(grav_param)
+        scaled_tof = sqrt_grav_param * tof
+
         # Compute the true anomaly between the two position vectors, then use the short_transfer flag to decide if the
         # short or large arc solution to Lamber's problem should be used.
         true_anomaly = (
-                np.arccos(np.dot(position1, position2) / (np.linalg.norm(position1) * np.linalg.norm(position2)))
+                np.arccos(_dot3(position1, position2) / (radius1 * radius2))
         )
         if not short_transfer:
             true_anomaly = 2 * np.pi - true_anomaly
@@ -357,7 +379,7 @@ class Orbit:
 
         # Define a constant to make carrying terms easier.
         lambert_const = (
-                np.sqrt(np.linalg.norm(position1) * np.linalg.norm(position2)) * np.sin(true_anomaly)
+                np.sqrt(radius1 * radius2) * np.sin(true_anomaly)
                 / np.sqrt(1 - np.cos(true_anomaly))
         )
 
@@ -370,38 +392,66 @@ class Orbit:
             stumpff_series_length=stumpff_series_length,
         )
 
-        # Solve Lambert's problem using a root-finding method to get the change in the Stumpff parameter between the
-        # two positions.
-        def eq(x):
+        # Solve Lambert's problem using Newton's method to get the change in the Stumpff parameter between the two
+        # positions. The analytic derivative of the time-of-flight wrt. the Stumpff parameter is taken from Curtis'
+        # "Orbital Mechanics for Engineering Students" (Eq. 5.43), using its limit at zero in the near-parabolic case.
+        # Steps are halved until they stay in the region where the Lambert parameter is positive and the Stumpff
+        # parameter is below (2pi)^2 (where the c_func vanishes) since the time-of-flight is undefined outside of it.
+        def lambert_terms(x):
             s_func, c_func = uv_propagator.stumpff_funcs(x)
-            lambert_param = (
-                    np.linalg.norm(position1) + np.linalg.norm(position2)
-                        - lambert_const * (1 - x * s_func) / np.sqrt(c_func)
-            )
-            universal_variable = np.sqrt(lambert_param / c_func)
-
-            return (
-                tof - (universal_variable ** 3 * s_func + lambert_const * np.sqrt(lambert_param))
-                    / np.sqrt(grav_param)
-            )
-        stumpff_param = sp.optimize.newton(eq, 0, tol=solver_tol)
+            lambert_param = radius1 + radius2 - lambert_const * (1 - x * s_func) / math.sqrt(c_func)
+            return s_func, c_func, lambert_param
+
+        stumpff_param = 0
+        s_func, c_func, lambert_param = lambert_terms(stumpff_param)
+        for _ in range(50):
+            universal_variable_sq = lambert_param / c_func
+            universal_variable_cb = universal_variable_sq * math.sqrt(universal_variable_sq)
+            sqrt_lambert_param = math.sqrt(lambert_param)
+
+            residual = universal_variable_cb * s_func + lambert_const * sqrt_lambert_param - scaled_tof
+            if abs(stumpff_param) < stumpff_tol:
+                derivative = (
+                        math.sqrt(2) / 40 * lambert_param * sqrt_lambert_param
+                            + lambert_const / 8 * (sqrt_lambert_param + lambert_const / math.sqrt(2 * lambert_param))
+                )
+            else:
+                derivative = (
+                        universal_variable_cb
+                            * ((c_func - 1.5 * s_func / c_func) / (2 * stumpff_param) + 0.75 * s_func ** 2 / c_func)
+                            + lambert_const / 8
+                            * (3 * s_func / c_func * sqrt_lambert_param
+                                + lambert_const / math.sqrt(universal_variable_sq))
+                )
+
+            step = residual / derivative
+            for _ in range(50):
+                new_stumpff_param = stumpff_param - step
+                if new_stumpff_param < 4 * np.pi ** 2:
+                    s_func, c_func, lambert_param = lambert_terms(new_stumpff_param)
+                    if lambert_param > 0:
+                        break
+                step /= 2
+            else:
+                raise RuntimeError(f"Failed to find a valid Newton step from {stumpff_param}.")
+            stumpff_param = new_stumpff_param
+            if abs(step) < solver_tol:
+                break
+        else:
+            raise RuntimeError(f"Failed to converge after 50 iterations, value is {stumpff_param}.")
 
-        # Compute the f and g functions from the resultant change in the Stumpff parameter.
-        s_func, c_func = uv_propagator.stumpff_funcs(stumpff_param)
-        lambert_param = (
-                np.linalg.norm(position1) + np.linalg.norm(position2)
-                - lambert_const * (1 - stumpff_param * s_func) / np.sqrt(c_func)
-        )
-        universal_variable = np.sqrt(lambert_param / c_func)
+        # Compute the f and g functions from the resultant change in the Stumpff parameter (the Stumpff functions and
+        # Lambert parameter were already evaluated at it on the last step).
+        universal_variable = math.sqrt(lambert_param / c_func)
 
-        f_func = 1 - universal_variable ** 2 / np.linalg.norm(position1) * c_func
-        g_func = tof - universal_variable ** 3 / np.sqrt(grav_param) * s_func
-        gdot_func = 1 - universal_variable ** 2 / np.linalg.norm(position2) * c_func
+        f_func = 1 - universal_variable ** 2 / radius1 * c_func
+        g_func = tof - universal_variable ** 3 / sqrt_grav_param * s_func
+        gdot_func = 1 - universal_variable ** 2 / radius2 * c_func
         if fg_constraint:
             fdot_func = (f_func * gdot_func - 1) / g_func
         else:
             fdot_func = (
-                    -np.sqrt(grav_param) / (np.linalg.norm(position1) * np.linalg.norm(position2))
+                    -sqrt_grav_param / (radius1 * radius2)
                         * universal_variable * (1 - stumpff_param * s_func)
             )
 
@@ -425,47 +475,42 @@ class Orbit:
     # ------------------------------
     # NOTE: Unless you know what you are doing just call update_all() because the order these are run in matters.
     def update_spf_angular_momentum(self):
-        self.spf_angular_momentum = np.cross(self.position, self.velocity)
+        self.spf_angular_momentum = _cross3(self.position, self.velocity)
 
     def update_eccentricity(self):  # This one updates eccentricity and eccentricity vector.
         self.eccentricity_vec = (
-                np.cross(self.velocity, self.spf_angular_momentum)
-                / self.grav_param - self.position / np.linalg.norm(self.position)
+                _cross3(self.velocity, self.spf_angular_momentum)
+                / self.grav_param - self.position / _norm3(self.position)
         )
-        self.eccentricity = np.linalg.norm(self.eccentricity_vec)
+        self.eccentricity = _norm3(self.eccentricity_vec)
 
-    def update_nodal_vec(self):
-        unit_vec_3 = np.array([0, 0, 1])
-        self.nodal_vec = np.cross(unit_vec_3, self.spf_angular_momentum)
+    def update_nodal_vec(self):  # Cross-product of the 3-axis with the angular momentum.
+        # 0 - h_2 rather than -h_2 so that an equatorial orbit (h_2 = 0) gets +0 like np.cross() does and not -0, which
+        # would make atan2() put the raan at pi instead of 0.
+        self.nodal_vec = np.array([0.0 - self.spf_angular_momentum[1], self.spf_angular_momentum[0], 0.0])
 
     def update_sl_rectum(self):
-        self.sl_rectum = np.linalg.norm(self.spf_angular_momentum) ** 2 / self.grav_param
+        self.sl_rectum = _norm3(self.spf_angular_momentum) ** 2 / self.grav_param
 
     def update_sm_axis(self):
         self.sm_axis = self.sl_rectum / (1 - self.eccentricity ** 2)
 
     def update_raan(self):
-        unit_vec_1 = np.array([1, 0, 0])
-        unit_vec_2 = np.array([0, 1, 0])
-        raan = np.arctan2(
-            np.dot(self.nodal_vec, unit_vec_2),
-            np.dot(self.nodal_vec, unit_vec_1)
-        )
+        raan = np.arctan2(self.nodal_vec[1], self.nodal_vec[0])
         if raan < 0:  # Wrap to [0, 2pi].
             raan += 2 * np.pi
         self.raan = raan
 
-    def update_inclination(self):
-        unit_vec_3 = np.array([0, 0, 1])
+    def update_inclination(self):  # Cross-product of the nodal vector with the 3-axis is [n_2, -n_1, 0].
         self.inclination = np.arctan2(
-            np.dot(self.spf_angular_momentum, np.cross(self.nodal_vec, unit_vec_3)),
-            np.linalg.norm(self.nodal_vec) * np.dot(self.spf_angular_momentum, unit_vec_3)
+            self.spf_angular_momentum[0] * self.nodal_vec[1] - self.spf_angular_momentum[1] * self.nodal_vec[0],
+            _norm3(self.nodal_vec) * self.spf_angular_momentum[2]
         )
 
     def update_argp(self):
         argp = np.arctan2(
-            np.dot(self.eccentricity_vec, np.cross(self.spf_angular_momentum, self.nodal_vec)),
-            np.linalg.norm(self.spf_angular_momentum) * np.dot(self.eccentricity_vec, self.nodal_vec)
+            _dot3(self.eccentricity_vec, _cross3(self.spf_angular_momentum, self.nodal_vec)),
+            _norm3(self.spf_angular_momentum) * _dot3(self.eccentricity_vec, self.nodal_vec)
         )
         if argp < 0:  # Wrap to [0, 2pi].
             argp += 2 * np.pi
@@ -485,8 +530,8 @@ class Orbit:
 
     def update_true_anomaly(self):
         true_anomaly = np.arctan2(
-            np.dot(self.position, np.cross(self.spf_angular_momentum, self.eccentricity_vec)),
-            np.linalg.norm(self.spf_angular_momentum) * np.dot(self.position, self.eccentricity_vec)
+            _dot3(self.position, _cross3(self.spf_angular_momentum, self.eccentricity_vec)),
+            _norm3(self.spf_angular_momentum) * _dot3(self.position, self.eccentricity_vec)
         )
         if true_anomaly < 0:  # Wrap to [0, 2pi].
             true_anomaly += 2 * np.pi
@@ -540,3 +585,19 @@ class Orbit:
         self.update_e_component2()
         self.update_n_component1()
         self.update_n_component2()
+
+
+# Inlined versions of np.cross(), np.linalg.norm(), and np.dot() for (3, ) vectors. The NumPy versions are general
+# purpose and so spend far longer dispatching than computing for vectors this small. Results are kept as NumPy scalars
+# so that arithmetic on them follows NumPy semantics, e.g. the semi-major axis of a parabolic orbit is inf rather than a
+# ZeroDivisionError.
+def _cross3(a: NDArray[float], b: NDArray[float]) -> NDArray[float]:
+    return np.array([a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]])
+
+
+def _norm3(a: NDArray[float]) -> float:
+    return np.float64(math.sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2]))
+
+
+def _dot3(a: NDArray[float], b: NDArray[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
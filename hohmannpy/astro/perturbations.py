@@ -1,8 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import functools
+import math
 import numpy as np
-import scipy as sp
-from ..dynamics import dcms
 import importlib.resources
 
 
@@ -29,64 +29,156 @@ class NonSphericalEarth(Perturbation):
         with importlib.resources.files("hohmannpy.resources").joinpath("egm84_s_coeffs.csv").open() as f:
             self.s_coeffs = np.loadtxt(f, delimiter=",")  # n-columns, m-rows, from [0, 180]
 
+        # Indices of the harmonics summed over in evaluate().
+        self._n_values = np.arange(1, self.order + 1)
+        self._m_values = np.arange(0, self.degree + 1)
+
         super().__init__()
 
     def evaluate(self, time: float, state: np.ndarray) -> tuple[float, float, float]:
         earth_radius = 6378137
         grav_param = 3.986004418e14
 
-        radius = np.sqrt(state[0] ** 2 + state[1] ** 2 + state[2] ** 2)
-        colatitude, longitude = self.compute_colat_and_long(time, state)
-
-        radial_accel = 0
-        longitudinal_accel = 0
-        colatitudinal_accel = 0
-
-        for n in range(1, self.order + 1):
-            for m in range(0, self.degree + 1):
-                radial_accel += (
-                    -(n + 1) * grav_param * earth_radius ** n / radius ** (n + 2)
-                        * sp.special.lpmv(m, n, np.cos(colatitude))
-                        * (self.c_coeffs[n, m] * np.cos(m * longitude) + self.s_coeffs[n, m] * np.sin(m * longitude))
-                )
-                longitudinal_accel += (
-                    1 / (radius * np.sin(colatitude))
-                        * grav_param * earth_radius ** n / radius ** (n + 1)
-                        * sp.special.lpmv(m, n, np.cos(colatitude))
-                        * m
-                        * (self.c_coeffs[n, m] * -np.sin(m * longitude) + self.s_coeffs[n, m] * np.cos(m * longitude))
-                )
-                if n == 0:
-                    continue
-                else:
-                    colatitudinal_accel += (
-                        1 / radius
-                            * grav_param * earth_radius ** n / radius ** (n + 1)
-                            * (n * np.cos(colatitude) * sp.special.lpmv(m, n, np.cos(colatitude))
-                                - (n + m) * sp.special.lpmv(m, n - 1, np.cos(colatitude)))
-                            / np.sin(colatitude)
-                            * (self.c_coeffs[n, m] * np.cos(m * longitude)
-                                + self.s_coeffs[n, m] * np.sin(m * longitude))
-                    )
-
-        curvilinear_accel = np.array([colatitudinal_accel, longitudinal_accel, radial_accel])
-        curvilinear_2_rectilinear = dcms.euler_2_dcm(longitude, 3).T @ dcms.euler_2_dcm(colatitude, 2).T
-        acceleration = curvilinear_2_rectilinear @ curvilinear_accel
-
-        return acceleration[0], acceleration[1], acceleration[2]
+        position = state[:3]
+        radius = np.sqrt(position[0] ** 2 + position[1] ** 2 + position[2] ** 2)
+        colatitude, longitude = self.compute_colat_and_long(time, position)
+        cos_colatitude = np.cos(colatitude)
+        sin_colatitude = np.sin(colatitude)
+
+        # Rather than looping over every harmonic, form the associated Legendre functions for all n and m at once along
+        # with the longitudinal terms and then sum over both n and m. Rows of legendre are n = [0, order] and columns
+        # m = [0, degree].
+        legendre = _alf_table(cos_colatitude, self.order, self.degree)
+        c_coeffs = self.c_coeffs[1:self.order + 1, :self.degree + 1]
+        s_coeffs = self.s_coeffs[1:self.order + 1, :self.degree + 1]
+        cos_m_longitude = np.cos(self._m_values * longitude)
+        sin_m_longitude = np.sin(self._m_values * longitude)
+        harmonics = c_coeffs * cos_m_longitude + s_coeffs * sin_m_longitude
+        harmonics_dlongitude = self._m_values * (s_coeffs * cos_m_longitude - c_coeffs * sin_m_longitude)
+
+        # grav_param * earth_radius^n / radius^(n + 2) for each n, formed as grav_param / radius^2 times (earth_radius /
+        # radius)^n. The powers of the ratio come from a running product rather than raising it to each n, the ratio is
+        # used since the radii themselves overflow for high orders.
+        grav_accel = grav_param / (radius * radius)
+        ratio_powers = np.cumprod(np.full(self.order, earth_radius / radius))
+        radial_scale = grav_accel * ratio_powers
+
+        radial_accel = -np.einsum(
+            "n,nm,nm->", (self._n_values + 1) * radial_scale, legendre[1:], harmonics
+        )
+        longitudinal_accel = np.einsum(
+            "n,nm,nm->", radial_scale, legendre[1:], harmonics_dlongitude
+        ) / sin_colatitude
+        colatitudinal_accel = np.einsum(
+            "n,nm,nm->",
+            radial_scale,
+            self._n_values[:, None] * cos_colatitude * legendre[1:]
+                - (self._n_values[:, None] + self._m_values) * legendre[:-1],
+            harmonics
+        ) / sin_colatitude
+
+        return _curvilinear_2_rectilinear(
+            cos_colatitude, sin_colatitude, longitude, colatitudinal_accel, longitudinal_accel, radial_accel
+        )
 
     def compute_colat_and_long(self, time, position):
         earth_rot = 7.292115e-5  # Mean rotation rate of the Earth in radians.
         gmst = self.initial_gmst + earth_rot * time
 
-        inertial_2_earth_dcm = dcms.euler_2_dcm(gmst, 3)
-        position = inertial_2_earth_dcm @ position
-        longitude = np.arctan2(position[1], position[0])
-        colatitude = np.pi / 2 - np.arctan2(position[2], np.sqrt(position[0] ** 2 + position[1] ** 2))
+        # Rotate into the Earth-fixed frame, equivalent to dcms.euler_2_dcm(gmst, 3) @ position. The 3-component is
+        # unchanged so only the first two are needed.
+        cos_gmst = math.cos(gmst)
+        sin_gmst = math.sin(gmst)
+        earth_position1 = cos_gmst * position[0] + sin_gmst * position[1]
+        earth_position2 = -sin_gmst * position[0] + cos_gmst * position[1]
+        longitude = math.atan2(earth_position2, earth_position1)
+        colatitude = math.pi / 2 - math.atan2(
+            position[2], math.sqrt(earth_position1 * earth_position1 + earth_position2 * earth_position2)
+        )
 
         return colatitude, longitude
 
 
+def _curvilinear_2_rectilinear(
+        cos_colatitude: float,
+        sin_colatitude: float,
+        longitude: float,
+        colatitudinal: float,
+        longitudinal: float,
+        radial: float,
+) -> tuple[float, float, float]:
+    """
+    Rotates a vector from its (colatitudinal, longitudinal, radial) components into rectilinear ones. Equivalent to
+    dcms.euler_2_dcm(longitude, 3).T @ dcms.euler_2_dcm(colatitude, 2).T @ vector, with both rotations applied as scalar
+    expressions rather than by forming and multiplying the DCMs.
+    """
+
+    # Undo the rotation about the 2-axis by the colatitude.
+    meridional = cos_colatitude * colatitudinal + sin_colatitude * radial
+    axial = -sin_colatitude * colatitudinal + cos_colatitude * radial
+
+    # Undo the rotation about the 3-axis by the longitude.
+    cos_longitude = math.cos(longitude)
+    sin_longitude = math.sin(longitude)
+
+    return (
+        cos_longitude * meridional - sin_longitude * longitudinal,
+        sin_longitude * meridional + cos_longitude * longitudinal,
+        axial,
+    )
+
+
+def _alf_table(x: float, max_n: int, max_m: int) -> np.ndarray:
+    """
+    Table of the associated Legendre functions P_n^m(x) for n = [0, max_n] and m = [0, max_m], including the
+    Condon-Shortley phase so that entries match sp.special.lpmv(m, n, x). Entries where m > n are zero.
+
+    The sectoral functions P_m^m = (-1)^m (2m - 1)!! (1 - x^2)^(m/2) are formed by a cumulative product and every other
+    row from the standard forward recursion in n,
+        P_n^m = ((2n - 1) x P_(n-1)^m - (n + m - 1) P_(n-2)^m) / (n - m),
+    applied to all m < n at once.
+    """
+
+    table = np.zeros([max_n + 1, max_m + 1])
+    m_values = np.arange(max_m + 1)
+
+    sectoral = np.cumprod(np.concatenate([[1.0], -(2 * m_values[1:] - 1) * np.sqrt(1 - x ** 2)]))
+    diagonal = np.arange(min(max_n, max_m) + 1)
+    table[diagonal, diagonal] = sectoral[diagonal]
+
+    for n in range(1, max_n + 1):
+        m = m_values[:min(n, max_m + 1)]
+        prev_prev_row = table[n - 2, m] if n > 1 else 0
+        table[n, m] = ((2 * n - 1) * x * table[n - 1, m] - (n + m - 1) * prev_prev_row) / (n - m)
+
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _load_density_curve(solar_activity: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    CIRA-12 density curve for the given level of solar activity, which density is linearly interpolated along. Cached so
+    that every AtmosphericDrag at the same level shares one copy rather than re-reading it from disk, the arrays are
+    read-only for this reason.
+
+    :return: Altitudes (km) and the corresponding densities (kg/m^3).
+    """
+
+    if solar_activity not in ("low", "moderate", "high"):
+        raise ValueError(f"{solar_activity} is not a valid level of solar activity.")
+
+    file_name = f"cira_12_{solar_activity}_activity.csv"
+    with importlib.resources.files("hohmannpy.resources").joinpath(file_name).open() as f:
+        density_curve = np.loadtxt(f, delimiter=",")
+
+    altitudes = np.ascontiguousarray(density_curve[:, 0])
+    densities = np.ascontiguousarray(density_curve[:, 1])
+    altitudes.setflags(write=False)
+    densities.setflags(write=False)
+
+    return altitudes, densities
+
+
 class AtmosphericDrag(Perturbation):
     def __init__(
             self,
@@ -102,68 +194,51 @@ class AtmosphericDrag(Perturbation):
         self.solar_activity = solar_activity
         self.solver_tol = solver_tol
 
-        match solar_activity:
-            case "low":
-                with importlib.resources.files("hohmannpy.resources").joinpath("cira_12_low_activity.csv").open() as f:
-                    density_curve = np.loadtxt(f, delimiter=",")  # altitude (km), density (kg/m^3)
-                    self.densities = sp.interpolate.make_interp_spline(
-                        density_curve[:, 0].squeeze(),
-                        density_curve[:, 1].squeeze(),
-                        k=1
-                    )
-            case "moderate":
-                with importlib.resources.files("hohmannpy.resources").joinpath("cira_12_moderate_activity.csv").open() as f:
-                    density_curve = np.loadtxt(f, delimiter=",")  # altitude (km), density (kg/m^3)
-                    self.densities = sp.interpolate.make_interp_spline(
-                        density_curve[:, 0].squeeze(),
-                        density_curve[:, 1].squeeze(),
-                        k=1
-                    )
-            case "high":
-                with importlib.resources.files("hohmannpy.resources").joinpath("cira_12_high_activity.csv").open() as f:
-                    density_curve = np.loadtxt(f, delimiter=",")  # altitude (km), density (kg/m^3)
-                    self.densities = sp.interpolate.make_interp_spline(
-                        density_curve[:, 0].squeeze(),
-                        density_curve[:, 1].squeeze(),
-                        k=1
-                    )
-        self.exosphere_bound = density_curve[-1, 0]
+        self.altitudes, self.densities = _load_density_curve(solar_activity)  # altitude (km), density (kg/m^3)
+        self.exosphere_bound = self.altitudes[-1]
 
     def evaluate(self, time: float, state: np.ndarray) -> tuple[float, float, float]:
         earth_rot = 7.292115e-5  # Mean rotation rate of the Earth in radians.
-        gmst = self.initial_gmst + earth_rot * time
 
-        inertial_2_earth_dcm = dcms.euler_2_dcm(gmst, 3)
-        position = inertial_2_earth_dcm @ state[:3]
-        altitude = self.compute_altitude(position)
+        # The geodetic altitude only depends on the distances from the Earth's spin axis and equatorial plane, neither
+        # of which changes when rotating into the Earth-fixed frame, so the inertial position is used directly.
+        altitude = self.compute_altitude(state[:3])
 
         if altitude / 1000 > self.exosphere_bound:
             return 0, 0, 0
 
-        density = self.densities(altitude / 1000)  # Need to convert m -> km
+        density = float(np.interp(altitude / 1000, self.altitudes, self.densities))  # Need to convert m -> km
 
-        velocity = state[3:] - np.cross(np.array([0, 0, earth_rot]), state[:3])
+        # Velocity relative to the atmosphere, v - w x r. The Earth's angular velocity only has a 3-component so the
+        # cross-product reduces to [-w * r_2, w * r_1, 0].
+        velocity1 = state[3] + earth_rot * state[1]
+        velocity2 = state[4] - earth_rot * state[0]
+        velocity3 = state[5]
 
-        acceleration = -0.5 * 1 / self.ballistic_coeff * density * np.linalg.norm(velocity) * velocity
+        drag_scale = (
+                -0.5 / self.ballistic_coeff * density
+                * math.sqrt(velocity1 * velocity1 + velocity2 * velocity2 + velocity3 * velocity3)
+        )
 
-        return acceleration[0], acceleration[1], acceleration[2]
+        return drag_scale * velocity1, drag_scale * velocity2, drag_scale * velocity3
 
     def compute_altitude(self, position: np.ndarray) -> float:
         earth_radius = 6378.1363e3
-        earth_eccentricity = 0.081819221456
+        earth_eccentricity_sq = 0.081819221456 ** 2
 
-        x = np.arctan2(position[2], np.sqrt(position[0] ** 2 + position[1] ** 2))
+        # Fixed-point iteration on the geodetic latitude.
+        equatorial_dist = math.sqrt(position[0] * position[0] + position[1] * position[1])
+        x = math.atan2(position[2], equatorial_dist)
         x_old = 100
         while abs(x - x_old) > self.solver_tol:
             x_old = x
-            radius_of_curvature = earth_radius / np.sqrt((1 - earth_eccentricity ** 2 * np.sin(x) ** 2))
-            x = np.arctan2(
-                position[2] + radius_of_curvature * earth_eccentricity ** 2 * np.sin(x),
-                np.sqrt(position[0] ** 2 + position[1] ** 2)
-            )
+            sin_x = math.sin(x)
+            radius_of_curvature = earth_radius / math.sqrt(1 - earth_eccentricity_sq * sin_x * sin_x)
+            x = math.atan2(position[2] + radius_of_curvature * earth_eccentricity_sq * sin_x, equatorial_dist)
 
         geodetic_latitude = x
-        radius_of_curvature = earth_radius / np.sqrt((1 - earth_eccentricity ** 2 * np.sin(x) ** 2))
-        altitude = np.sqrt(position[0] ** 2 + position[1] ** 2) / np.cos(geodetic_latitude) - radius_of_curvature
+        sin_x = math.sin(x)
+        radius_of_curvature = earth_radius / math.sqrt(1 - earth_eccentricity_sq * sin_x * sin_x)
+        altitude = equatorial_dist / math.cos(geodetic_latitude) - radius_of_curvature
 
         return altitude
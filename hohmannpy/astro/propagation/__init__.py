@@ -6,3 +6,8 @@ from .cowell import CowellPropagator
 from .kepler import KeplerPropagator
 #from .encke import EnckePropagator
 from .universal_variable import UniversalVariablePropagator
+
+# Batch propagation.
+from .batch import propagate_many
+
+# The JAX version of the universal variable propagator (jax_uv) is not imported here since JAX is optional.
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import math
+import numba
 import numpy as np
+from numpy.typing import NDArray
 from .. import orbit, perturbations, logging
 
 
@@ -21,9 +24,12 @@ class Propagator(ABC):
     :ivar final time: When to stop orbit propagation.
     :ivar step_size: Time step size for propagation.
     :ivar timesteps: How many discrete timesteps to propagate for.
+    :ivar dtype: Floating point type the Loggers store their histories in. Propagation itself is always done in double
+        precision, np.float32 halves the memory of the histories at the cost of about 7 significant digits per
+        stored value.
     """
 
-    def __init__(self, loggers: list[logging.Logger], step_size: float):
+    def __init__(self, loggers: list[logging.Logger], step_size: float, dtype: np.typing.DTypeLike = np.float64):
         """
         Pre-initialization, all these attributes (excluding step_size and loggers) are not filled in till setup() is
         called.
@@ -31,6 +37,7 @@ class Propagator(ABC):
 
         self.step_size = step_size
         self.loggers = loggers
+        self.dtype = np.dtype(dtype)
 
         self.orbit = None
         self.perturbations = None
@@ -65,7 +72,14 @@ class Propagator(ABC):
         if self.step_size is None:  # Default to 10000 steps.
             self.step_size = (final_time - self.orbit.time) / 10000
 
-        self.timesteps = int(np.floor((self.final_time - orbit.time) / self.step_size))
+        # Only whole timesteps are taken. A duration which is an exact multiple of the step size can come out of the
+        # division a hair under the whole number (e.g. 0.3 / 0.1 = 2.9999999999999996), so snap to it before flooring.
+        step_ratio = (self.final_time - orbit.time) / self.step_size
+        nearest_timestep = round(step_ratio)
+        if math.isclose(step_ratio, nearest_timestep, rel_tol=1e-12):
+            self.timesteps = nearest_timestep
+        else:
+            self.timesteps = math.floor(step_ratio)
 
 
     def log(self, timestep):
@@ -74,5 +88,35 @@ class Propagator(ABC):
 
         :param timestep: Current discrete timestep in propagation.
         """
+        assert timestep <= self.timesteps, f"Timestep {timestep} is past the last allocated timestep {self.timesteps}."
         for logger in self.loggers:
             logger.log(propagator=self, timestep=timestep)
+
+    def latitude_histories(self, true_anomaly_history: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+        """
+        Vectorized equivalent of calling Orbit.update_argl() and Orbit.update_true_latitude() on every timestep. Only
+        valid for unperturbed propagation where the raan and argp are fixed.
+
+        :param true_anomaly_history: True anomaly on every timestep, wrapped to [0, 2pi].
+
+        :return: The argument of latitude and true latitude on every timestep, wrapped to [0, 2pi].
+        """
+
+        argl_history = self.orbit.argp + true_anomaly_history
+        argl_history = np.where(argl_history > 2 * np.pi, argl_history % (2 * np.pi), argl_history)
+        true_latitude_history = self.orbit.raan + self.orbit.argp + true_anomaly_history
+        true_latitude_history = np.where(
+            true_latitude_history > 2 * np.pi, true_latitude_history % (2 * np.pi), true_latitude_history
+        )
+
+        return argl_history, true_latitude_history
+
+
+@numba.njit(cache=True, fastmath=True)
+def _sincos(angle):
+    """
+    Sine and cosine of the same angle for use inside the compiled propagation kernels. Evaluating the two side by side
+    lets LLVM fuse them into a single sincos call which shares the argument reduction.
+    """
+
+    return math.sin(angle), math.cos(angle)
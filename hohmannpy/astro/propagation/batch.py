@@ -0,0 +1,144 @@
+from __future__ import annotations
+import math
+import numba
+import numpy as np
+from numpy.typing import NDArray
+from .universal_variable import _propagate_universal_variable, _stumpff_series_coeffs
+
+
+def propagate_many(
+        initial_positions: NDArray[float],
+        initial_velocities: NDArray[float],
+        step_size: float,
+        timesteps: int,
+        grav_param: float = 3.986004418e14,  # Default to Earth in units of m^3/s^2.
+        solver_tol: float = 1e-8,
+        stumpff_tol: float = 1e-8,
+        stumpff_series_length: int = 10,
+        fg_constraint: bool = True,
+) -> tuple[NDArray[float], NDArray[float]]:
+    """
+    Propagates a batch of unperturbed orbits, such as a constellation, which share the same epoch and central body
+    using the universal variable formulation. Rather than looping over a propagator per orbit in Python, the orbits are
+    stored as (M, 3) arrays and propagated in parallel by a compiled kernel, each orbit being handled exactly as
+    UniversalVariablePropagator.propagate() would. There is no Orbit or Logger bookkeeping, raw state histories are
+    returned.
+
+    NOTE: All orbits share one epoch and time grid, and there are no per-orbit epochs. Orbits known at different epochs
+    must first be brought to a common epoch, for instance by propagating each one separately.
+
+    :param initial_positions: Positions at epoch, a (M, 3) array.
+    :param initial_velocities: Velocities at epoch, a (M, 3) array.
+    :param step_size: Time between consecutive states.
+    :param timesteps: Number of timesteps to propagate for after epoch.
+    :param grav_param: Constant related to the gravitational field strength of the central body.
+    :param solver_tol: Tolerance to use when solving Kepler's equation.
+    :param stumpff_tol: Minimum absolute value of the Stumpff parameter before switching to the infinite series
+        definition of the Stumpff series.
+    :param stumpff_series_length: How many terms to evaluate in the Stumpff series when using their infinite series
+        definitions.
+    :param fg_constraint: Whether to compute the gdot-series independently (increasing computation time) or to instead
+        use the series constraint (faster but less accurate).
+
+    :return: The position and velocity history of each orbit, both (M, timesteps + 1, 3) arrays where the 0th state is
+        the epoch.
+    """
+
+    initial_positions = np.ascontiguousarray(initial_positions, dtype=float)
+    initial_velocities = np.ascontiguousarray(initial_velocities, dtype=float)
+    time_history = step_size * np.arange(timesteps + 1)
+
+    s_series_coeffs, c_series_coeffs = _stumpff_series_coeffs(stumpff_series_length)
+
+    position_history = np.empty([initial_positions.shape[0], timesteps + 1, 3])
+    velocity_history = np.empty([initial_positions.shape[0], timesteps + 1, 3])
+    _propagate_many(
+        initial_positions,
+        initial_velocities,
+        time_history,
+        float(grav_param),
+        float(solver_tol),
+        float(stumpff_tol),
+        s_series_coeffs,
+        c_series_coeffs,
+        fg_constraint,
+        position_history,
+        velocity_history,
+    )
+
+    return position_history, velocity_history
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def _propagate_many(
+        initial_positions,
+        initial_velocities,
+        time_history,
+        grav_param,
+        solver_tol,
+        stumpff_tol,
+        s_series_coeffs,
+        c_series_coeffs,
+        fg_constraint,
+        position_history,
+        velocity_history,
+):
+    """
+    Compiled kernel of propagate_many(). Each orbit is independent so they are spread across threads, every thread
+    running the universal variable kernel on its orbit and forming the states from the resulting f and g functions
+    directly into the (M, N + 1, 3) outputs.
+    """
+
+    for orbit in numba.prange(initial_positions.shape[0]):
+        initial_position = initial_positions[orbit]
+        initial_velocity = initial_velocities[orbit]
+        initial_radius = math.sqrt(
+            initial_position[0] * initial_position[0]
+            + initial_position[1] * initial_position[1]
+            + initial_position[2] * initial_position[2]
+        )
+        initial_speed_sq = (
+                initial_velocity[0] * initial_velocity[0]
+                + initial_velocity[1] * initial_velocity[1]
+                + initial_velocity[2] * initial_velocity[2]
+        )
+        inverse_sm_axis = 2 / initial_radius - initial_speed_sq / grav_param
+
+        lagrange_coeff_history = np.empty((time_history.shape[0], 2, 2))
+        universal_variable_history = np.empty(time_history.shape[0])
+        stumpff_param_history = np.empty(time_history.shape[0])
+        _propagate_universal_variable(
+            initial_position,
+            initial_velocity,
+            time_history,
+            grav_param,
+            inverse_sm_axis,
+            solver_tol,
+            stumpff_tol,
+            s_series_coeffs,
+            c_series_coeffs,
+            fg_constraint,
+            lagrange_coeff_history,
+            universal_variable_history,
+            stumpff_param_history,
+        )
+
+        for timestep in range(time_history.shape[0]):
+            for axis in range(3):
+                position_history[orbit, timestep, axis] = (
+                        lagrange_coeff_history[timestep, 0, 0] * initial_position[axis]
+                        + lagrange_coeff_history[timestep, 0, 1] * initial_velocity[axis]
+                )
+                velocity_history[orbit, timestep, axis] = (
+                        lagrange_coeff_history[timestep, 1, 0] * initial_position[axis]
+                        + lagrange_coeff_history[timestep, 1, 1] * initial_velocity[axis]
+                )
+
+
+def _warmup():
+    """
+    Compiles the kernel (or loads it from the on-disk cache) on a trivial two-step orbit so that the first call to
+    propagate_many() does not pay for it. Called by hohmannpy.warmup().
+    """
+
+    propagate_many(np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 1.0, 0.0]]), 0.0, 1, grav_param=1.0)
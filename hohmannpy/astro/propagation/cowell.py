@@ -24,6 +24,7 @@ class CowellPropagator(base.Propagator):
             step_size: float = None,
             absolute_solver_tol: float = 1e-15,
             relative_solver_tol: float = 1e-12,
+            dtype: np.typing.DTypeLike = np.float64,
     ):
         self.absolute_solver_tol = absolute_solver_tol
         self.relative_solver_tol = relative_solver_tol
@@ -31,7 +32,7 @@ class CowellPropagator(base.Propagator):
         if loggers is None:  # Default loggers.
             loggers = [logging.StateLogger()]
 
-        super().__init__(loggers, step_size)
+        super().__init__(loggers, step_size, dtype)
 
     def propagate(self):
         """
@@ -50,12 +51,13 @@ class CowellPropagator(base.Propagator):
         for logger in self.loggers:
             logger.setup(self)
 
-        # Use scipy's solve_ivp() to numerically integrate the equations of motion.
+        # Use scipy's solve_ivp() to numerically integrate the equations of motion. The solution is evaluated on the
+        # timestep grid, which stops at the last whole timestep before the final time.
         initial_state = np.hstack((initial_position, initial_velocity))
-        eval_times = np.linspace(initial_time, self.final_time, self.timesteps + 1)
+        eval_times = initial_time + self.step_size * np.arange(self.timesteps + 1)
         sol = sp.integrate.solve_ivp(
             self.eom,
-            [initial_time, self.final_time],
+            [initial_time, eval_times[-1]],
             initial_state,
             t_eval=eval_times,
             atol=self.absolute_solver_tol,
@@ -64,7 +66,7 @@ class CowellPropagator(base.Propagator):
 
         # Extract propagation results.
         for timestep in range(1, self.timesteps + 1):
-            self.orbit.time += self.step_size
+            self.orbit.time = eval_times[timestep]
 
             # Extract position.
             self.orbit.position = sol.y[0:3, timestep]
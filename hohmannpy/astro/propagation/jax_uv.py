@@ -0,0 +1,282 @@
+"""
+JAX version of the universal variable propagator for propagating many orbits over many times at once on a GPU/TPU.
+
+For an unperturbed orbit the state at any time depends only on the initial conditions, so propagation has two
+independent axes of parallelism: over times and over orbits. propagate_one() solves Kepler's equation for every time at
+once as array operations and propagate_batch() vectorizes this over a batch of orbits, lowering to a single compiled
+kernel. Unlike UniversalVariablePropagator there is no Orbit or Logger bookkeeping, raw state histories are returned.
+
+NOTE: JAX is an optional dependency (pip install hohmannpy[jax]) and is only imported by this module. JAX computes in
+float32 unless its 64-bit mode is enabled, which this module leaves to the user since it is a process-wide setting:
+call jax.config.update("jax_enable_x64", True) at startup, or wrap the calls in the jax.enable_x64(True) context
+manager. The computation then follows the dtype of the initial conditions passed in, so float32 inputs may still be
+used to trade accuracy for speed. This is adequate for most closed orbits but not for near-parabolic ones, where the
+inverse of the semi-major axis is lost to cancellation.
+"""
+
+from __future__ import annotations
+import functools
+import jax
+import jax.numpy as jnp
+
+
+def stumpff_funcs(
+        stumpff_param: jax.Array,
+        stumpff_tol: float = 1e-8,
+        stumpff_series_length: int = 10,
+) -> tuple[jax.Array, jax.Array]:
+    """
+    Elementwise version of UniversalVariablePropagator.stumpff_funcs(). All three cases are evaluated and the right
+    one selected for each entry. Each case is evaluated on a copy of the parameter where the entries it does not handle
+    are swapped for a harmless value, since an inf or nan they would otherwise produce still poisons gradients even
+    though it is never selected.
+
+    :param stumpff_param: Stumpff parameter.
+    :param stumpff_tol: Minimum absolute value of the Stumpff parameter before switching to the infinite series
+        definition of the Stumpff series.
+    :param stumpff_series_length: How many terms to evaluate in the Stumpff series when using their infinite series
+        definitions.
+
+    :return: The "sine and cosine" Stumpff series referred to as the s_func and c_func.
+    """
+
+    near_parabolic = jnp.abs(stumpff_param) < stumpff_tol
+    elliptic = ~near_parabolic & (stumpff_param > 0)
+
+    # Near-parabolic case. Each term is formed from the previous one via the ratio of consecutive terms.
+    series_param = jnp.where(near_parabolic, stumpff_param, 0)
+    s_term = jnp.full_like(stumpff_param, 1 / 6)
+    c_term = jnp.full_like(stumpff_param, 1 / 2)
+    s_series = jnp.zeros_like(stumpff_param)
+    c_series = jnp.zeros_like(stumpff_param)
+    for k in range(stumpff_series_length):
+        s_series += s_term
+        c_series += c_term
+        s_term *= -series_param / ((2 * k + 4) * (2 * k + 5))
+        c_term *= -series_param / ((2 * k + 3) * (2 * k + 4))
+
+    # Elliptic case.
+    elliptic_param = jnp.where(elliptic, stumpff_param, 1)
+    root_param = jnp.sqrt(elliptic_param)
+    s_elliptic = (root_param - jnp.sin(root_param)) / (elliptic_param * root_param)
+    c_elliptic = (1 - jnp.cos(root_param)) / elliptic_param
+
+    # Hyperbolic case.
+    hyperbolic_param = jnp.where(near_parabolic | elliptic, -1, stumpff_param)
+    root_param = jnp.sqrt(-hyperbolic_param)
+    s_hyperbolic = (jnp.sinh(root_param) - root_param) / (-hyperbolic_param * root_param)
+    c_hyperbolic = (1 - jnp.cosh(root_param)) / hyperbolic_param
+
+    s_func = jnp.where(near_parabolic, s_series, jnp.where(elliptic, s_elliptic, s_hyperbolic))
+    c_func = jnp.where(near_parabolic, c_series, jnp.where(elliptic, c_elliptic, c_hyperbolic))
+
+    return s_func, c_func
+
+
+def kepler_residual(
+        universal_variable: jax.Array,
+        initial_radius: jax.Array,
+        initial_radial_vel: jax.Array,
+        sqrt_grav_param: jax.Array,
+        inverse_sm_axis: jax.Array,
+        elapsed_time: jax.Array,
+        stumpff_tol: float = 1e-8,
+        stumpff_series_length: int = 10,
+) -> tuple[jax.Array, jax.Array]:
+    """
+    Residual of the universal variable form of Kepler's equation along with its derivative wrt. the universal
+    variable, which is the radius.
+
+    :param universal_variable: Universal variable.
+    :param initial_radius: Radius at start of propagation.
+    :param initial_radial_vel: Dot product of the initial position and velocity divided by sqrt(grav_param).
+    :param sqrt_grav_param: Square root of the gravitational parameter.
+    :param inverse_sm_axis: Inverse of the semi-major axis.
+    :param elapsed_time: Time since the start of propagation.
+    :param stumpff_tol: See stumpff_funcs().
+    :param stumpff_series_length: See stumpff_funcs().
+
+    :return: The residual and radius at the universal variable.
+    """
+
+    universal_variable_sq = universal_variable * universal_variable
+    stumpff_param = inverse_sm_axis * universal_variable_sq
+    s_func, c_func = stumpff_funcs(stumpff_param, stumpff_tol, stumpff_series_length)
+
+    residual = (
+            universal_variable_sq * universal_variable * s_func
+            + initial_radial_vel * universal_variable_sq * c_func
+            + initial_radius * universal_variable * (1 - stumpff_param * s_func)
+            - sqrt_grav_param * elapsed_time
+    )
+    radius = (
+            universal_variable_sq * c_func
+            + initial_radial_vel * universal_variable * (1 - stumpff_param * s_func)
+            + initial_radius * (1 - stumpff_param * c_func)
+    )
+
+    return residual, radius
+
+
+def universal_variable_guess(
+        elapsed_time: jax.Array,
+        initial_radius: jax.Array,
+        initial_radial_vel: jax.Array,
+        sqrt_grav_param: jax.Array,
+        inverse_sm_axis: jax.Array,
+        sl_rectum: jax.Array,
+) -> jax.Array:
+    """
+    Elementwise version of the initial guess used by UniversalVariablePropagator, see
+    universal_variable._universal_variable_guess() for the details of each case.
+
+    :param elapsed_time: Time since the start of propagation.
+    :param initial_radius: Radius at start of propagation.
+    :param initial_radial_vel: Dot product of the initial position and velocity divided by sqrt(grav_param).
+    :param sqrt_grav_param: Square root of the gravitational parameter.
+    :param inverse_sm_axis: Inverse of the semi-major axis.
+    :param sl_rectum: Semi-latus rectum.
+
+    :return: Initial guess for the universal variable after the elapsed time.
+    """
+
+    shape_param = inverse_sm_axis * initial_radius  # r0 / a.
+    sqrt_inverse_sm_axis = jnp.sqrt(jnp.abs(inverse_sm_axis))
+    mean_motion = sqrt_grav_param * jnp.abs(inverse_sm_axis) * sqrt_inverse_sm_axis
+    e_sin_initial_eccentric_anomaly = initial_radial_vel * sqrt_inverse_sm_axis  # Also e * sinh() if hyperbolic.
+    e_cos_initial_eccentric_anomaly = 1 - shape_param  # Also e * cosh() if hyperbolic.
+
+    # Elliptic case.
+    initial_eccentric_anomaly = jnp.arctan2(e_sin_initial_eccentric_anomaly, e_cos_initial_eccentric_anomaly)
+    mean_anomaly = initial_eccentric_anomaly - e_sin_initial_eccentric_anomaly + mean_motion * elapsed_time
+    eccentric_anomaly = mean_anomaly + jnp.where(
+        mean_anomaly % (2 * jnp.pi) > jnp.pi,
+        -jnp.hypot(e_sin_initial_eccentric_anomaly, e_cos_initial_eccentric_anomaly),
+        jnp.hypot(e_sin_initial_eccentric_anomaly, e_cos_initial_eccentric_anomaly)
+    )
+    elliptic_guess = (eccentric_anomaly - initial_eccentric_anomaly) / sqrt_inverse_sm_axis
+
+    # Parabolic case.
+    half_angle = 0.5 * jnp.arctan2(1, 3 * sqrt_grav_param / jnp.sqrt(sl_rectum ** 3) * elapsed_time)
+    quarter_angle = jnp.arctan(jnp.cbrt(jnp.tan(half_angle)))
+    parabolic_guess = 2 * jnp.sqrt(sl_rectum) / jnp.tan(2 * quarter_angle)
+
+    # Hyperbolic case.
+    eccentricity = jnp.sqrt(jnp.abs(e_cos_initial_eccentric_anomaly ** 2 - e_sin_initial_eccentric_anomaly ** 2))
+    initial_eccentric_anomaly = jnp.arcsinh(e_sin_initial_eccentric_anomaly / eccentricity)
+    mean_anomaly = e_sin_initial_eccentric_anomaly - initial_eccentric_anomaly + mean_motion * elapsed_time
+    eccentric_anomaly = jnp.arcsinh(mean_anomaly / eccentricity)
+    hyperbolic_guess = (eccentric_anomaly - initial_eccentric_anomaly) / sqrt_inverse_sm_axis
+
+    return jnp.where(
+        shape_param > 1e-6, elliptic_guess, jnp.where(shape_param > -1e-6, parabolic_guess, hyperbolic_guess)
+    )
+
+
+def propagate_one(
+        initial_position: jax.Array,
+        initial_velocity: jax.Array,
+        elapsed_times: jax.Array,
+        grav_param: float = 3.986004418e14,  # Default to Earth in units of m^3/s^2.
+        solver_iterations: int = 50,
+        stumpff_tol: float = 1e-8,
+        stumpff_series_length: int = 10,
+        fg_constraint: bool = True,
+) -> tuple[jax.Array, jax.Array]:
+    """
+    Propagates a single orbit to all the given times at once. Kepler's equation is solved with a fixed number of
+    Newton iterations, so that the loop can be compiled by XLA, starting from an independent initial guess at each time.
+
+    :param initial_position: Position at start of propagation, a (3, ) vector.
+    :param initial_velocity: Velocity at start of propagation, a (3, ) vector.
+    :param elapsed_times: Times since the start of propagation to find the state at, a (N, ) vector.
+    :param grav_param: Constant related to the gravitational field strength of the central body.
+    :param solver_iterations: How many Newton iterations to use when solving Kepler's equation.
+    :param stumpff_tol: See stumpff_funcs().
+    :param stumpff_series_length: See stumpff_funcs().
+    :param fg_constraint: Whether to compute the gdot-series independently or to instead use the series constraint.
+
+    :return: The position and velocity on each time, both (N, 3) arrays.
+    """
+
+    # Quantities which are invariant over the whole propagation.
+    sqrt_grav_param = jnp.sqrt(grav_param)
+    initial_radius = jnp.sqrt(initial_position @ initial_position)
+    initial_radial_vel = initial_position @ initial_velocity / sqrt_grav_param
+    inverse_sm_axis = (2 * grav_param / initial_radius - initial_velocity @ initial_velocity) / grav_param
+    spf_angular_momentum = jnp.cross(initial_position, initial_velocity)
+    sl_rectum = spf_angular_momentum @ spf_angular_momentum / grav_param
+
+    # Compute the universal variable on every time.
+    def newton_step(_, universal_variable):
+        residual, radius = kepler_residual(
+            universal_variable, initial_radius, initial_radial_vel, sqrt_grav_param, inverse_sm_axis, elapsed_times,
+            stumpff_tol, stumpff_series_length
+        )
+        return universal_variable - residual / radius
+
+    universal_variable = universal_variable_guess(
+        elapsed_times, initial_radius, initial_radial_vel, sqrt_grav_param, inverse_sm_axis, sl_rectum
+    )
+    universal_variable = jax.lax.fori_loop(0, solver_iterations, newton_step, universal_variable)
+
+    # Compute the f and g functions and their derivatives on every time.
+    universal_variable_sq = universal_variable * universal_variable
+    stumpff_param = inverse_sm_axis * universal_variable_sq
+    s_func, c_func = stumpff_funcs(stumpff_param, stumpff_tol, stumpff_series_length)
+    _, radius = kepler_residual(
+        universal_variable, initial_radius, initial_radial_vel, sqrt_grav_param, inverse_sm_axis, elapsed_times,
+        stumpff_tol, stumpff_series_length
+    )
+    f_func = 1 - universal_variable_sq / initial_radius * c_func
+    g_func = elapsed_times - universal_variable_sq * universal_variable / sqrt_grav_param * s_func
+    fdot_func = sqrt_grav_param / (radius * initial_radius) * universal_variable * (stumpff_param * s_func - 1)
+    if fg_constraint:
+        gdot_func = (g_func * fdot_func + 1) / f_func
+    else:
+        gdot_func = 1 - universal_variable_sq / radius * c_func
+
+    position = f_func[:, None] * initial_position + g_func[:, None] * initial_velocity
+    velocity = fdot_func[:, None] * initial_position + gdot_func[:, None] * initial_velocity
+
+    return position, velocity
+
+
+@functools.partial(jax.jit, static_argnames=("solver_iterations", "stumpff_series_length", "fg_constraint"))
+def propagate_batch(
+        initial_positions: jax.Array,
+        initial_velocities: jax.Array,
+        elapsed_times: jax.Array,
+        grav_param: float = 3.986004418e14,  # Default to Earth in units of m^3/s^2.
+        solver_iterations: int = 50,
+        stumpff_tol: float = 1e-8,
+        stumpff_series_length: int = 10,
+        fg_constraint: bool = True,
+) -> tuple[jax.Array, jax.Array]:
+    """
+    Compiled version of propagate_one() vectorized over a batch of orbits which share the same times and central body.
+    Runs in float32 unless JAX's 64-bit mode has been enabled, see the module docstring.
+
+    :param initial_positions: Positions at start of propagation, a (M, 3) array.
+    :param initial_velocities: Velocities at start of propagation, a (M, 3) array.
+    :param elapsed_times: Times since the start of propagation to find the states at, a (N, ) vector.
+    :param grav_param: Constant related to the gravitational field strength of the central body.
+    :param solver_iterations: See propagate_one().
+    :param stumpff_tol: See stumpff_funcs().
+    :param stumpff_series_length: See stumpff_funcs().
+    :param fg_constraint: See propagate_one().
+
+    :return: The position and velocity of each orbit on each time, both (M, N, 3) arrays.
+    """
+
+    propagate = functools.partial(
+        propagate_one,
+        solver_iterations=solver_iterations,
+        stumpff_tol=stumpff_tol,
+        stumpff_series_length=stumpff_series_length,
+        fg_constraint=fg_constraint,
+    )
+
+    return jax.vmap(propagate, in_axes=(0, 0, None, None))(
+        initial_positions, initial_velocities, elapsed_times, grav_param
+    )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from . import base
+import math
+import numba
 import numpy as np
 from numpy.typing import NDArray
-import scipy as sp
 from .. import logging
 
 
@@ -24,6 +25,8 @@ class UniversalVariablePropagator(base.Propagator):
         definition of the Stumpff series.
     :ivar stumpff_series_length: How many terms to evaluate in the Stumpff series when using their infinite series
         definitions.
+    :ivar s_series_coeffs: Coefficients of the infinite series definition of the s_func, 1 / (2k + 3)!.
+    :ivar c_series_coeffs: Coefficients of the infinite series definition of the c_func, 1 / (2k + 2)!.
 
     [PROPAGATION METHOD PARAMETERS]
     :ivar universal_variable:
@@ -37,13 +40,16 @@ class UniversalVariablePropagator(base.Propagator):
             solver_tol: float = 1e-8,
             stumpff_tol: float = 1e-8,
             stumpff_series_length: int = 10,
-            fg_constraint: bool = True
+            fg_constraint: bool = True,
+            dtype: np.typing.DTypeLike = np.float64,
     ):
         self.fg_constraint = fg_constraint
         self.solver_tol = solver_tol
         self.stumpff_tol = stumpff_tol
         self.stumpff_series_length = stumpff_series_length
 
+        self.s_series_coeffs, self.c_series_coeffs = _stumpff_series_coeffs(stumpff_series_length)
+
         self.inverse_sm_axis = None
         self.universal_variable = None
         self.stumpff_param = None
@@ -51,18 +57,19 @@ class UniversalVariablePropagator(base.Propagator):
         if loggers is None:  # Default loggers.
             loggers = [logging.StateLogger(), logging.UniversalVariableLogger()]
 
-        super().__init__(loggers, step_size)
+        super().__init__(loggers, step_size, dtype)
 
     def propagate(self):
         """
         The procedure for this style of propagation is as follows:
             1) Save initial position and velocity as well as the initial universal variable.
-            2) Compute the new universal variable on the next time step from Kepler's equation. This involves computing
-                the Stumpff series
+            2) Compute the new universal variable on a time step from Kepler's equation. This involves computing the
+                Stumpff series
             3) Recompute the Stumpff series using the new universal variable for use in computing the f and g functions.
             4) Form the f and g functions and use them to compute the new position.
             5) Form the fdot and gdot functions and use them and the new position to compute the new velocity.
-            6) Repeat 2-5 until the final time is reached.
+            6) Repeat 2-5 for every timestep. Since there is no dependence between timesteps these may be done in any
+                order.
         """
 
         # Get initial values used for propagation.
@@ -70,6 +77,7 @@ class UniversalVariablePropagator(base.Propagator):
         initial_position = self.orbit.position.copy()
         initial_velocity = self.orbit.velocity.copy()
         self.universal_variable = 0  # By definition always starts at 0 when propagation begins.
+        self.stumpff_param = 0
 
         # Set up Loggers.
         for logger in self.loggers:
@@ -77,54 +85,68 @@ class UniversalVariablePropagator(base.Propagator):
 
         # Compute the inverse of the semi-major axis. This is needed to handle parabolic orbits where otherwise division
         # by a semi-major axis of 0 would occur.
+        grav_param = float(self.orbit.grav_param)
         self.inverse_sm_axis = (
-            (2 * self.orbit.grav_param / np.linalg.norm(initial_position) - np.linalg.norm(initial_velocity) ** 2)
-                / self.orbit.grav_param
+            2 / math.sqrt(initial_position @ initial_position) - (initial_velocity @ initial_velocity) / grav_param
         )
 
-        # Propagation.
-        for timestep in range(1, self.timesteps + 1):
-            self.orbit.time += self.step_size
-
-            # Compute new universal variable. Use the previous universal variable as the initial guess for the
-            # root-finder.
-            self.universal_variable = self.kepler_equation(
-                initial_time=initial_time,
-                initial_position=initial_position,
-                initial_velocity=initial_velocity,
-                initial_guess=self.universal_variable,
-            )
-
-            # Compute the Stumpff (c and s) functions.
-            self.stumpff_param = self.inverse_sm_axis * self.universal_variable ** 2
-            s_func, c_func = self.stumpff_funcs(self.stumpff_param)
-
-            # Compute the f and g functions.
-            f_func = 1 - self.universal_variable ** 2 / np.linalg.norm(initial_position) * c_func
-            g_func = (
-                    self.orbit.time - initial_time
-                        - self.universal_variable ** 3 / np.sqrt(self.orbit.grav_param) * s_func
-            )
-
-            # Compute new position (and true anomaly).
-            self.orbit.position = f_func * initial_position + g_func * initial_velocity
-            self.orbit.update_true_anomaly()
-            self.orbit.update_argl()
-            self.orbit.update_true_latitude()
-
-            # Compute fdot and gdot functions.
-            fdot_func = (
-                    np.sqrt(self.orbit.grav_param)
-                        / (np.linalg.norm(self.orbit.position) * np.linalg.norm(initial_position))
-                        * self.universal_variable * (self.stumpff_param * s_func - 1)
-            )
-            if self.fg_constraint:  # Only compute gdot function manually if constraint usage is disabled.
-                gdot_func = (g_func * fdot_func + 1) / f_func
-            else:
-                gdot_func = 1 - self.universal_variable ** 2 / np.linalg.norm(self.orbit.position) * c_func
+        # Propagation. Times are taken from the timestep grid rather than accumulated to avoid floating-point drift. The
+        # whole loop, including solving Kepler's equation, runs in a compiled kernel which writes the f and g functions
+        # and their derivatives into a preallocated array.
+        time_history = initial_time + self.step_size * np.arange(self.timesteps + 1)
+        lagrange_coeff_history = np.empty([self.timesteps + 1, 2, 2])
+        universal_variable_history = np.empty(self.timesteps + 1)
+        stumpff_param_history = np.empty(self.timesteps + 1)
+        _propagate_universal_variable(
+            initial_position,
+            initial_velocity,
+            time_history,
+            grav_param,
+            float(self.inverse_sm_axis),
+            float(self.solver_tol),
+            float(self.stumpff_tol),
+            self.s_series_coeffs,
+            self.c_series_coeffs,
+            self.fg_constraint,
+            lagrange_coeff_history,
+            universal_variable_history,
+            stumpff_param_history,
+        )
 
-            # Compute new velocities.
-            self.orbit.velocity = fdot_func * initial_position + gdot_func * initial_velocity
+        # Form the state on every timestep at once, [r; v] = [[f, g], [fdot, gdot]] @ [r0; v0], as one batched matrix
+        # product. state_history[timestep, 0] is then the position and state_history[timestep, 1] the velocity.
+        state_history = lagrange_coeff_history @ np.stack([initial_position, initial_velocity])
+
+        # Recover the true anomaly and the angles built on it on all timesteps at once. The orbit is unperturbed so the
+        # angular momentum and eccentricity vectors are invariant and their cross-product only needs to be formed once.
+        spf_angular_momentum = self.orbit.spf_angular_momentum
+        eccentricity_vec = self.orbit.eccentricity_vec
+        true_anomaly_history = np.arctan2(
+            state_history[:, 0] @ np.cross(spf_angular_momentum, eccentricity_vec),
+            math.sqrt(spf_angular_momentum @ spf_angular_momentum) * (state_history[:, 0] @ eccentricity_vec),
+        )
+        true_anomaly_history[true_anomaly_history < 0] += 2 * np.pi  # Wrap to [0, 2pi].
+        argl_history, true_latitude_history = self.latitude_histories(true_anomaly_history)
+
+        # Replay the histories through the orbit for the Loggers. Everything has already been computed so each timestep
+        # is only attribute stores, with the scalar histories as lists of Python floats which are cheaper to index than
+        # NumPy arrays.
+        orbit = self.orbit
+        time_list = time_history.tolist()
+        universal_variable_list = universal_variable_history.tolist()
+        stumpff_param_list = stumpff_param_history.tolist()
+        true_anomaly_list = true_anomaly_history.tolist()
+        argl_list = argl_history.tolist()
+        true_latitude_list = true_latitude_history.tolist()
+        for timestep in range(1, self.timesteps + 1):
+            orbit.time = time_list[timestep]
+            orbit.position = state_history[timestep, 0]
+            orbit.velocity = state_history[timestep, 1]
+            orbit.true_anomaly = true_anomaly_list[timestep]
+            orbit.argl = argl_list[timestep]
+            orbit.true_latitude = true_latitude_list[timestep]
+            self.universal_variable = universal_variable_list[timestep]
+            self.stumpff_param = stumpff_param_list[timestep]
 
             # Save results.
             self.log(timestep)
@@ -142,61 +164,241 @@ class UniversalVariablePropagator(base.Propagator):
         :return: The "sine and cosine" Stumpff series referred to as the s_func and c_func.
         """
 
-        if np.abs(stumpff_param) < self.stumpff_tol:  # Near-parabolic case.
-            s_func = 0
-            c_func = 0
-            for i in range(self.stumpff_series_length):
-                s_func += (-stumpff_param) ** i / sp.special.factorial(2 * i + 3)
-                c_func += (-stumpff_param) ** i / sp.special.factorial(2 * i + 2)
-        elif stumpff_param > 0:  # Elliptic case.
-            s_func = (
-                    (np.sqrt(stumpff_param) - np.sin(np.sqrt(stumpff_param))) / np.sqrt(stumpff_param ** 3)
-            )
-            c_func = (
-                    (1 - np.cos(np.sqrt(stumpff_param))) / stumpff_param
-            )
-        else:  # Hyperbolic case.
-            s_func = (
-                    (np.sinh(np.sqrt(-stumpff_param)) - np.sqrt(-stumpff_param)) / np.sqrt(-stumpff_param ** 3)
-            )
-            c_func = (
-                    (1 - np.cosh(np.sqrt(-stumpff_param))) / stumpff_param
-            )
+        return _stumpff_funcs(float(stumpff_param), float(self.stumpff_tol), self.s_series_coeffs, self.c_series_coeffs)
 
-        return s_func, c_func
 
-    def kepler_equation(
-            self,
-            initial_time: float,
-            initial_position: NDArray[float],
-            initial_velocity: NDArray[float],
-            initial_guess: float,
-    ) -> float:
-        """
-        Function which yields the universal variable at the current time (as stored by self.orbit.time).
+def _stumpff_series_coeffs(stumpff_series_length: int) -> tuple[NDArray[float], NDArray[float]]:
+    """
+    Coefficients of the infinite series definitions of the s_func and c_func, 1 / (2k + 3)! and 1 / (2k + 2)!. The
+    series are in powers of the Stumpff parameter, so their coefficients are fixed once the number of terms is.
 
-        :param initial_time: Time at start of propagation
-        :param initial_position: Position at start of propagation, a (3, ) vector.
-        :param initial_velocity: Velocity at start of propagation, a (3, ) vector.
-        :param initial_guess: Initial guess for the universal variable.
+    :param stumpff_series_length: How many terms to evaluate in the Stumpff series.
 
-        :return: New universal variable at the current time plus the desired timestep.
-        """
+    :return: The s_func and c_func series coefficients.
+    """
+
+    s_series_coeffs = np.array([1 / math.factorial(2 * k + 3) for k in range(stumpff_series_length)])
+    c_series_coeffs = np.array([1 / math.factorial(2 * k + 2) for k in range(stumpff_series_length)])
+
+    return s_series_coeffs, c_series_coeffs
 
-        # Create the function to use in root-finding.
-        def eq(x):
-            stumpff_param = self.inverse_sm_axis * x ** 2
-            s_func, c_func = self.stumpff_funcs(stumpff_param)
-
-            return (
-                    x ** 3 * s_func
-                        + np.dot(initial_position, initial_velocity) / np.sqrt(self.orbit.grav_param)
-                        * x ** 2 * c_func
-                        + np.linalg.norm(initial_position) * x * (1 - stumpff_param * s_func)
-                        - np.sqrt(self.orbit.grav_param) * (self.orbit.time - initial_time)
+
+@numba.njit(cache=True, fastmath=True)
+def _stumpff_funcs(stumpff_param, stumpff_tol, s_series_coeffs, c_series_coeffs):
+    """
+    Compiled kernel of UniversalVariablePropagator.stumpff_funcs(). In the near-parabolic case the two series, which are
+    polynomials in -psi with the precomputed coefficients 1 / (2k + 3)! and 1 / (2k + 2)!, are evaluated with Horner's
+    rule. This needs one multiply-add per term and sums the smallest terms first.
+    """
+
+    if abs(stumpff_param) < stumpff_tol:  # Near-parabolic case.
+        s_func = 0.0
+        c_func = 0.0
+        for k in range(s_series_coeffs.shape[0] - 1, -1, -1):
+            s_func = s_func * -stumpff_param + s_series_coeffs[k]
+            c_func = c_func * -stumpff_param + c_series_coeffs[k]
+    elif stumpff_param > 0:  # Elliptic case.
+        root_param = math.sqrt(stumpff_param)  # Shared by both series, psi^(3/2) is then psi * sqrt(psi).
+        sin_root_param, cos_root_param = base._sincos(root_param)
+        s_func = (root_param - sin_root_param) / (stumpff_param * root_param)
+        c_func = (1 - cos_root_param) / stumpff_param
+    else:  # Hyperbolic case.
+        root_param = math.sqrt(-stumpff_param)
+        s_func = (math.sinh(root_param) - root_param) / (-stumpff_param * root_param)
+        c_func = (1 - math.cosh(root_param)) / stumpff_param
+
+    return s_func, c_func
+
+
+@numba.njit(cache=True, fastmath=True)
+def _propagate_universal_variable(
+        initial_position,
+        initial_velocity,
+        time_history,
+        grav_param,
+        inverse_sm_axis,
+        solver_tol,
+        stumpff_tol,
+        s_series_coeffs,
+        c_series_coeffs,
+        fg_constraint,
+        lagrange_coeff_history,
+        universal_variable_history,
+        stumpff_param_history,
+):
+    """
+    Compiled kernel of UniversalVariablePropagator.propagate(). Given the (N + 1, ) time grid fills in the (N + 1, 2, 2)
+    history of the matrix [[f, g], [fdot, gdot]] of f and g functions and their derivatives along with the (N + 1, )
+    universal variable and Stumpff parameter histories in-place, starting with the initial conditions in the 0th entry.
+
+    Kepler's equation is solved with Newton's method. Its derivative wrt. the universal variable is the new radius,
+    x^2 C + (r0 . v0) / sqrt(mu) x (1 - psi S) + r0 (1 - psi C), so no vectors need to be formed here. Every timestep
+    starts from its own initial guess from _universal_variable_guess() so no timestep depends on another.
+    """
+
+    # Quantities which are invariant over the whole propagation.
+    initial_time = time_history[0]
+    sqrt_grav_param = math.sqrt(grav_param)
+    initial_radius = math.sqrt(
+        initial_position[0] * initial_position[0]
+        + initial_position[1] * initial_position[1]
+        + initial_position[2] * initial_position[2]
+    )
+    initial_radial_vel = (
+            initial_position[0] * initial_velocity[0]
+            + initial_position[1] * initial_velocity[1]
+            + initial_position[2] * initial_velocity[2]
+    ) / sqrt_grav_param
+    spf_angular_momentum_sq = (
+            (initial_position[1] * initial_velocity[2] - initial_position[2] * initial_velocity[1]) ** 2
+            + (initial_position[2] * initial_velocity[0] - initial_position[0] * initial_velocity[2]) ** 2
+            + (initial_position[0] * initial_velocity[1] - initial_position[1] * initial_velocity[0]) ** 2
+    )
+    sl_rectum = spf_angular_momentum_sq / grav_param
+
+    lagrange_coeff_history[0, 0, 0] = 1
+    lagrange_coeff_history[0, 0, 1] = 0
+    lagrange_coeff_history[0, 1, 0] = 0
+    lagrange_coeff_history[0, 1, 1] = 1
+    universal_variable_history[0] = 0
+    stumpff_param_history[0] = 0
+
+    for timestep in range(1, time_history.shape[0]):
+        elapsed_time = time_history[timestep] - initial_time
+
+        # Compute new universal variable.
+        universal_variable = _universal_variable_guess(
+            elapsed_time, sqrt_grav_param, inverse_sm_axis, initial_radius, initial_radial_vel, sl_rectum
+        )
+        previous_step = math.inf
+        for _ in range(50):
+            universal_variable_sq = universal_variable * universal_variable
+            stumpff_param = inverse_sm_axis * universal_variable_sq
+            s_func, c_func = _stumpff_funcs(stumpff_param, stumpff_tol, s_series_coeffs, c_series_coeffs)
+            residual = (
+                    universal_variable_sq * universal_variable * s_func
+                    + initial_radial_vel * universal_variable_sq * c_func
+                    + initial_radius * universal_variable * (1 - stumpff_param * s_func)
+                    - sqrt_grav_param * elapsed_time
             )
+            radius = (
+                    universal_variable_sq * c_func
+                    + initial_radial_vel * universal_variable * (1 - stumpff_param * s_func)
+                    + initial_radius * (1 - stumpff_param * c_func)
+            )
+            step = residual / radius
+            universal_variable -= step
+
+            # The tolerance is absolute so for large universal variables it can sit below the rounding error of Kepler's
+            # equation, in which case the steps bottom out and bounce around the root instead of shrinking further. Once
+            # a step is within sqrt(eps) of the universal variable Newton's method would otherwise square it, so a step
+            # which fails to shrink there means the root has been found as accurately as double precision allows.
+            if abs(step) < solver_tol or (
+                    abs(step) >= abs(previous_step) and abs(step) < 1.5e-8 * abs(universal_variable)
+            ):
+                break
+            previous_step = step
+        else:
+            raise RuntimeError("Failed to converge after 50 iterations.")
+
+        # Compute the Stumpff (c and s) functions, and from these the new radius, at the new universal variable.
+        universal_variable_sq = universal_variable * universal_variable
+        stumpff_param = inverse_sm_axis * universal_variable_sq
+        s_func, c_func = _stumpff_funcs(stumpff_param, stumpff_tol, s_series_coeffs, c_series_coeffs)
+        radius = (
+                universal_variable_sq * c_func
+                + initial_radial_vel * universal_variable * (1 - stumpff_param * s_func)
+                + initial_radius * (1 - stumpff_param * c_func)
+        )
 
-        # Root-finding.
-        universal_variable = sp.optimize.newton(eq, initial_guess, tol=self.solver_tol)
+        # Compute the f and g functions.
+        f_func = 1 - universal_variable_sq / initial_radius * c_func
+        g_func = elapsed_time - universal_variable_sq * universal_variable / sqrt_grav_param * s_func
+
+        # Compute fdot and gdot functions.
+        fdot_func = (
+                sqrt_grav_param / (radius * initial_radius) * universal_variable * (stumpff_param * s_func - 1)
+        )
+        if fg_constraint:  # Only compute gdot function manually if constraint usage is disabled.
+            gdot_func = (g_func * fdot_func + 1) / f_func
+        else:
+            gdot_func = 1 - universal_variable_sq / radius * c_func
+
+        lagrange_coeff_history[timestep, 0, 0] = f_func
+        lagrange_coeff_history[timestep, 0, 1] = g_func
+        lagrange_coeff_history[timestep, 1, 0] = fdot_func
+        lagrange_coeff_history[timestep, 1, 1] = gdot_func
+        universal_variable_history[timestep] = universal_variable
+        stumpff_param_history[timestep] = stumpff_param
+
+
+@numba.njit(cache=True, fastmath=True)
+def _universal_variable_guess(
+        elapsed_time,
+        sqrt_grav_param,
+        inverse_sm_axis,
+        initial_radius,
+        initial_radial_vel,
+        sl_rectum,
+):
+    """
+    Initial guess for the universal variable after the elapsed time. These depend only on the initial conditions so
+    that the universal variable on each timestep can be solved for independently:
+        - Elliptic: The universal variable is the change in eccentric anomaly times the square root of the semi-major
+            axis. The eccentric anomaly is estimated with the same starter used by KeplerPropagator, the mean anomaly
+            plus or minus the eccentricity, which holds up for all eccentricities and any number of revolutions.
+        - Parabolic: The exact universal variable from Barker's equation.
+        - Hyperbolic: As in the elliptic case but with the hyperbolic eccentric anomaly, estimated with the
+            KeplerPropagator starter asinh(M / e), and the square root of the negative semi-major axis.
+    The initial (hyperbolic) eccentric anomaly and eccentricity are recovered from the initial radius and radial
+    velocity. Which case applies is decided by the dimensionless r0 / a to be insensitive to the units used.
+
+    NOTE: initial_radial_vel is (r0 . v0) / sqrt(mu).
+    """
+
+    shape_param = inverse_sm_axis * initial_radius  # r0 / a.
+    if shape_param > 1e-6:  # Elliptic case.
+        sqrt_inverse_sm_axis = math.sqrt(inverse_sm_axis)
+        e_sin_initial_eccentric_anomaly = initial_radial_vel * sqrt_inverse_sm_axis
+        e_cos_initial_eccentric_anomaly = 1 - shape_param
+        eccentricity = math.sqrt(e_sin_initial_eccentric_anomaly ** 2 + e_cos_initial_eccentric_anomaly ** 2)
+        initial_eccentric_anomaly = math.atan2(e_sin_initial_eccentric_anomaly, e_cos_initial_eccentric_anomaly)
+        mean_anomaly = (
+                initial_eccentric_anomaly - e_sin_initial_eccentric_anomaly
+                    + sqrt_grav_param * inverse_sm_axis * sqrt_inverse_sm_axis * elapsed_time
+        )
+        wrapped_mean_anomaly = mean_anomaly % (2 * math.pi)
+        if wrapped_mean_anomaly > math.pi:
+            eccentric_anomaly = mean_anomaly - eccentricity
+        else:
+            eccentric_anomaly = mean_anomaly + eccentricity
+        return (eccentric_anomaly - initial_eccentric_anomaly) / sqrt_inverse_sm_axis
+    elif shape_param > -1e-6:  # Parabolic case.
+        half_angle = 0.5 * math.atan2(1, 3 * sqrt_grav_param / math.sqrt(sl_rectum ** 3) * elapsed_time)
+        quarter_angle = math.atan(math.tan(half_angle) ** (1 / 3))  # tan(half_angle) > 0.
+        return 2 * math.sqrt(sl_rectum) / math.tan(2 * quarter_angle)
+    else:  # Hyperbolic case.
+        sqrt_inverse_sm_axis = math.sqrt(-inverse_sm_axis)
+        e_sinh_initial_eccentric_anomaly = initial_radial_vel * sqrt_inverse_sm_axis
+        e_cosh_initial_eccentric_anomaly = 1 - shape_param
+        eccentricity = math.sqrt(e_cosh_initial_eccentric_anomaly ** 2 - e_sinh_initial_eccentric_anomaly ** 2)
+        initial_eccentric_anomaly = math.asinh(e_sinh_initial_eccentric_anomaly / eccentricity)
+        mean_anomaly = (
+                e_sinh_initial_eccentric_anomaly - initial_eccentric_anomaly
+                    + sqrt_grav_param * -inverse_sm_axis * sqrt_inverse_sm_axis * elapsed_time
+        )
+        eccentric_anomaly = math.asinh(mean_anomaly / eccentricity)
+        return (eccentric_anomaly - initial_eccentric_anomaly) / sqrt_inverse_sm_axis
+
+
+def _warmup():
+    """
+    Compiles the kernels (or loads them from the on-disk cache), the propagation kernel on a trivial two-step orbit, so
+    that the first call to propagate() does not pay for it. Called by hohmannpy.warmup().
+    """
 
-        return universal_variable
+    _stumpff_funcs(0.0, 1e-8, np.ones(2), np.ones(2))
+    _propagate_universal_variable(
+        np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), np.zeros(2), 1.0, 1.0, 1e-8, 1e-8, np.ones(2), np.ones(2),
+        True, np.zeros([2, 2, 2]), np.zeros(2), np.zeros(2)
+    )
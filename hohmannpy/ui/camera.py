@@ -1,7 +1,7 @@
 from __future__ import annotations
+import math
 import time
 
-import numpy as np
 import pygfx as gfx
 
 
@@ -93,6 +93,9 @@ class OrbitalCamera(gfx.PerspectiveCamera):
         rotating down.
     stored_time: float
         Global timestamp at the last time :meth:`orient()` was called.
+    last_position: tuple
+        Position the camera was moved to the last time :meth:`orient()` was called. Used to detect when the camera has
+        not moved since, so that the update can be skipped.
     """
 
     def __init__(
@@ -136,6 +139,7 @@ class OrbitalCamera(gfx.PerspectiveCamera):
         self.elevation_dynamics_flag: int = 0
 
         self.stored_time: float = time.perf_counter()
+        self.last_position: tuple | None = None
 
         super().__init__(fov, aspect)
 
@@ -196,61 +200,85 @@ class OrbitalCamera(gfx.PerspectiveCamera):
         # pygfx.OrbitController may have been used to move the camera between calls to this function.
         x, y, z = self.local.position
 
+        time_change = time.perf_counter() - self.stored_time
+        self.stored_time = time.perf_counter()
+
+        # With no user input, no residual velocity, and no mouse movement since the last call the update below would
+        # leave the camera where it is, so skip it.
+        if (
+                self.radial_dynamics_flag == 0 and self.azimuth_dynamics_flag == 0 and self.elevation_dynamics_flag == 0
+                and self.radial_vel == 0 and self.azimuth_vel == 0 and self.elevation_vel == 0
+                and (x, y, z) == self.last_position
+        ):
+            return
+
         # Compute radius, elevation, and azimuth.
-        radius = np.sqrt(x**2 + y**2 + z**2)
+        radius = math.sqrt(x * x + y * y + z * z)
         if radius != 0:  # Safeguard because camera is oriented before mouse position is set.
             self.radius = radius
-            self.elevation = np.arcsin(z / self.radius)
-            self.azimuth = np.arctan2(y, x)
+            self.elevation = math.asin(z / self.radius)
+            self.azimuth = math.atan2(y, x)
 
         # Evaluate dynamics.
-        time_change = time.perf_counter() - self.stored_time
-        self.stored_time = time.perf_counter()
         match self.radial_dynamics_flag:
             case 0:
-                self.radial_vel *= np.exp(-self.radial_damping * time_change)
+                self.radial_vel *= math.exp(-self.radial_damping * time_change)
             case 1:
                 self.radial_vel += self.radial_accel * time_change
             case -1:
                 self.radial_vel -= self.radial_accel * time_change
-        self.radial_vel = np.clip(self.radial_vel, -self.max_radial_vel, self.max_radial_vel)
+        self.radial_vel = min(max(self.radial_vel, -self.max_radial_vel), self.max_radial_vel)
         match self.azimuth_dynamics_flag:
             case 0:
-                self.azimuth_vel *= np.exp(-self.azimuth_damping * time_change)
+                self.azimuth_vel *= math.exp(-self.azimuth_damping * time_change)
             case 1:
                 self.azimuth_vel += self.azimuth_accel * time_change
             case -1:
                 self.azimuth_vel -= self.azimuth_accel * time_change
-        self.azimuth_vel = np.clip(self.azimuth_vel, -self.max_azimuth_vel, self.max_azimuth_vel)
+        self.azimuth_vel = min(max(self.azimuth_vel, -self.max_azimuth_vel), self.max_azimuth_vel)
         match self.elevation_dynamics_flag:
             case 0:
-                self.elevation_vel *= np.exp(-self.elevation_damping * time_change)
+                self.elevation_vel *= math.exp(-self.elevation_damping * time_change)
             case 1:
                 self.elevation_vel += self.elevation_accel * time_change
             case -1:
                 self.elevation_vel -= self.elevation_accel * time_change
-        self.elevation_vel = np.clip(self.elevation_vel, -self.max_elevation_vel, self.max_elevation_vel)
+        self.elevation_vel = min(max(self.elevation_vel, -self.max_elevation_vel), self.max_elevation_vel)
+
+        # Exponential damping never reaches zero on its own, so snap negligible velocities to rest. Otherwise the camera
+        # would never be considered idle above.
+        if abs(self.radial_vel) < 1e-6:
+            self.radial_vel = 0
+        if abs(self.azimuth_vel) < 1e-6:
+            self.azimuth_vel = 0
+        if abs(self.elevation_vel) < 1e-6:
+            self.elevation_vel = 0
 
         self.elevation += self.elevation_vel * time_change
         self.azimuth += self.azimuth_vel * time_change
         self.radius += self.radial_vel * time_change
 
         # Clamp radius, azimuth, and elevation.
-        self.radius = np.max([self.radius, self.min_radius])
-        self.azimuth %= 2 * np.pi
+        self.radius = max(self.radius, self.min_radius)
+        self.azimuth %= 2 * math.pi
 
-        if self.elevation <= -np.pi / 2 + 1e-3:
-            self.elevation = -np.pi / 2 + 1e-3
+        if self.elevation <= -math.pi / 2 + 1e-3:
+            self.elevation = -math.pi / 2 + 1e-3
             self.elevation_vel = 0
-        if self.elevation >= np.pi / 2 - 1e-3:
-            self.elevation = np.pi / 2 - 1e-3
+        if self.elevation >= math.pi / 2 - 1e-3:
+            self.elevation = math.pi / 2 - 1e-3
             self.elevation_vel = 0
 
-        # Update Cartesian position and of the camera.
-        x = self.radius * np.cos(self.elevation) * np.cos(self.azimuth)
-        y = self.radius * np.cos(self.elevation) * np.sin(self.azimuth)
-        z = self.radius * np.sin(self.elevation)
+        # Update Cartesian position and of the camera. The sine and cosine of each angle are only formed once.
+        cos_elevation = math.cos(self.elevation)
+        sin_elevation = math.sin(self.elevation)
+        cos_azimuth = math.cos(self.azimuth)
+        sin_azimuth = math.sin(self.azimuth)
+        x = self.radius * cos_elevation * cos_azimuth
+        y = self.radius * cos_elevation * sin_azimuth
+        z = self.radius * sin_elevation
         self.local.position = (x, y, z)
+        self.last_position = tuple(self.local.position)  # Read back since the camera may store it at lower precision.
 
         # Point towards [0, 0, 0] with the z-axis as up. This last setting controls the camera's roll-orientation.
         self.show_pos((0, 0, 0), up=(0, 0, 1))
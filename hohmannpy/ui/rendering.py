@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import time
 
 import numpy as np
@@ -32,7 +33,7 @@ class RenderEngine:
     Parameters
     ----------
     traj: np.ndarray
-        A (3, N) array of position vectors where N corresponds to the number of discrete timesteps propagated when
+        A (N, 3) array of position vectors where N corresponds to the number of discrete timesteps propagated when
         :class:`~hohmannpy.astro.Mission` . :meth:`~hohmannpy.astro.Mission.simulate()` is called. Positions should be
         in units of :math:`m`.
     draw_basis: bool
@@ -258,10 +259,8 @@ class RenderEngine:
         earth_mat.map = gfx.Texture(earth_img, dim=2)
 
         # Create the Earth object using the texture.
-        earth = gfx.Mesh(
-            gfx.sphere_geometry(radius=6371, width_segments=64, height_segments=32),
-            earth_mat
-        )
+        earth = gfx.Mesh(_unit_sphere(), earth_mat)
+        earth.local.scale = (6371, 6371, 6371)
         earth.local.rotation = la.quat_from_euler(
             (np.pi / 2, 0, 0), order="XYZ"
         ) # Rotate Earth since texture is 90 deg offset about x-axis, then offset terminator in new body frame.
@@ -300,7 +299,7 @@ class RenderEngine:
         Parameters
         ----------
         traj: np.ndarray
-            A (3, N) array of position vectors where N corresponds to the number of discrete timesteps propagated when
+            A (N, 3) array of position vectors where N corresponds to the number of discrete timesteps propagated when
             :class:`~hohmannpy.astro.Mission` . :meth:`~hohmannpy.astro.Mission.simulate()` is called. Positions should
             be in units of :math:`m`.
 
@@ -310,7 +309,7 @@ class RenderEngine:
             Orbit object generated from the ``traj`` parameter.
         """
 
-        orbit = traj.T / 1000  # Scale to engine units (km).
+        orbit = traj / 1000  # Scale to engine units (km).
         orbit = orbit.astype(np.float32)  # Data type needed by gfx.Geometry.
 
         return gfx.Line(gfx.Geometry(positions=orbit), gfx.LineMaterial(thickness=2, color=gfx.Color("#FF073A")))
@@ -331,7 +330,7 @@ class DynamicRenderEngine(RenderEngine):
     Parameters
     ----------
     traj: np.ndarray
-        A (3, N) array of position vectors where N corresponds to the number of discrete timesteps propagated when
+        A (N, 3) array of position vectors where N corresponds to the number of discrete timesteps propagated when
         :class:`~hohmannpy.astro.Mission` . :meth:`~hohmannpy.astro.Mission.simulate()` is called. Positions should be
         in units of :math:`m`.
     times: np.ndarray
@@ -411,7 +410,7 @@ class DynamicRenderEngine(RenderEngine):
         self.old_speed_factor = 0
 
         # Generate the orbital spline.
-        self.orbit_spline = sp.interpolate.make_interp_spline(times.squeeze(), traj.T / 1000, k=1)
+        self.orbit_spline = sp.interpolate.make_interp_spline(times.squeeze(), traj / 1000, k=1)
 
         # Rotate the Earth to start at the correct GMST, this overwrites any base-class rotation.
         self.base_earth_rotation = la.quat_from_euler(
@@ -510,9 +509,29 @@ class DynamicRenderEngine(RenderEngine):
         """
 
         sat_mat =  gfx.MeshPhongMaterial(color=gfx.Color("#FF073A"), flat_shading=True)
-        satellite = gfx.Mesh(
-            gfx.sphere_geometry(radius=300, width_segments=64, height_segments=32),
-            sat_mat
-        )
+        satellite = gfx.Mesh(_unit_sphere(), sat_mat)
+        satellite.local.scale = (300, 300, 300)
 
         return satellite
+
+
+@functools.lru_cache(maxsize=16)
+def _unit_sphere(width_segments: int = 64, height_segments: int = 32) -> gfx.Geometry:
+    r"""
+    Sphere geometry of unit radius shared by every sphere in every scene (the Earth, satellites, etc.), each of which is
+    sized by scaling its own :class:`pygfx.Mesh`. This way the vertex buffers are only generated and uploaded once.
+
+    Parameters
+    ----------
+    width_segments: int
+        Number of segments around the equator.
+    height_segments: int
+        Number of segments from pole to pole.
+
+    Returns
+    -------
+    sphere: :class:`pygfx.Geometry`
+        The cached geometry.
+    """
+
+    return gfx.sphere_geometry(radius=1, width_segments=width_segments, height_segments=height_segments)
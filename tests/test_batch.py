@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+
+from hohmannpy.astro import Orbit, UniversalVariablePropagator, propagate_many
+
+GRAV_PARAM = 3.986004418e14
+
+
+def test_propagate_many_matches_universal_variable_propagator():
+    orbits = [
+        Orbit.from_classical_elements(7e6, 0.1, 0.3, 0.9, 0.2, 0.1),  # Elliptic.
+        Orbit.from_classical_elements(-2e7, 1.5, 0.3, 0.9, 0.2, 0.1),  # Hyperbolic.
+        Orbit.from_state(  # Near-parabolic, e = 1 - 4e-10.
+            np.array([7e6, 0.0, 0.0]), np.array([0.0, math.sqrt(2 * GRAV_PARAM / 7e6) * (1 - 1e-10), 0.0])
+        ),
+    ]
+    initial_positions = np.array([orbit.position for orbit in orbits])
+    initial_velocities = np.array([orbit.velocity for orbit in orbits])
+    step_size = 10.0
+    timesteps = 600
+
+    position_histories, velocity_histories = propagate_many(
+        initial_positions, initial_velocities, step_size, timesteps
+    )
+
+    assert position_histories.shape == (len(orbits), timesteps + 1, 3)
+    assert velocity_histories.shape == (len(orbits), timesteps + 1, 3)
+    for orbit, position_history, velocity_history in zip(orbits, position_histories, velocity_histories):
+        propagator = UniversalVariablePropagator(step_size=step_size)
+        propagator.setup(orbit, [], step_size * timesteps)
+        propagator.propagate()
+
+        np.testing.assert_allclose(position_history, propagator.loggers[0].position_history, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(velocity_history, propagator.loggers[0].velocity_history, rtol=0, atol=1e-8)
@@ -0,0 +1,13 @@
+import numpy as np
+
+from hohmannpy.astro import state_2_classical, state_2_classical_p
+
+
+def test_equatorial_state_raan_is_zero():
+    position = np.array([7e6, 0.0, 0.0])
+    velocity = np.array([0.0, 8e3, 0.0])
+
+    for elements in (state_2_classical(position, velocity), state_2_classical_p(position, velocity)):
+        _, _, raan, inclination, _, _ = elements
+        assert raan == 0
+        assert inclination == 0
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from hohmannpy.astro import CowellPropagator, KeplerPropagator, Orbit, UniversalVariablePropagator
+
+# Largest position difference, in meters, allowed between a float32 and a float64 propagation of the same orbit.
+POSITION_TOL = 1.0
+
+
+def _propagate(propagator_class, dtype):
+    orbit = Orbit.from_classical_elements(7e6, 0.01, 0.3, 0.9, 0.2, 0.1)  # LEO.
+    propagator = propagator_class(step_size=10.0, dtype=dtype)
+    propagator.setup(orbit, [], 6000.0)
+    propagator.propagate()
+
+    return propagator.loggers[0]
+
+
+@pytest.mark.parametrize("propagator_class", [KeplerPropagator, UniversalVariablePropagator, CowellPropagator])
+def test_float32_matches_float64(propagator_class):
+    logger_64 = _propagate(propagator_class, np.float64)
+    logger_32 = _propagate(propagator_class, np.float32)
+
+    assert logger_64.position_history.dtype == np.float64
+    assert logger_64.velocity_history.dtype == np.float64
+    assert logger_32.position_history.dtype == np.float32
+    assert logger_32.velocity_history.dtype == np.float32
+    assert np.max(np.abs(logger_32.position_history - logger_64.position_history)) < POSITION_TOL
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from hohmannpy.astro import Orbit, propagate_many
+
+jax = pytest.importorskip("jax")
+jax_uv = pytest.importorskip("hohmannpy.astro.propagation.jax_uv")
+
+
+def test_propagate_batch_matches_propagate_many():
+    orbits = [
+        Orbit.from_classical_elements(7e6, 0.1, 0.3, 0.9, 0.2, 0.1),  # Elliptic.
+        Orbit.from_classical_elements(-2e7, 1.5, 0.3, 0.9, 0.2, 0.1),  # Hyperbolic.
+    ]
+    initial_positions = np.array([orbit.position for orbit in orbits])
+    initial_velocities = np.array([orbit.velocity for orbit in orbits])
+    step_size = 10.0
+    timesteps = 600
+
+    position_histories, velocity_histories = propagate_many(
+        initial_positions, initial_velocities, step_size, timesteps
+    )
+    with jax.enable_x64(True):
+        jax_position_histories, jax_velocity_histories = jax_uv.propagate_batch(
+            jax.numpy.asarray(initial_positions),
+            jax.numpy.asarray(initial_velocities),
+            jax.numpy.asarray(step_size * np.arange(timesteps + 1)),
+        )
+
+    np.testing.assert_allclose(jax_position_histories, position_histories, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(jax_velocity_histories, velocity_histories, rtol=0, atol=1e-8)
+
+
+@pytest.mark.parametrize("stumpff_param", [0.0, 1e3, 1e6, -1e3])
+def test_stumpff_funcs_gradient_is_finite(stumpff_param):
+    # At 1e6 the unselected hyperbolic case overflows, which used to turn the gradient into nan.
+    with jax.enable_x64(True):
+        for output in range(2):
+            gradient = jax.grad(lambda param: jax_uv.stumpff_funcs(param)[output])(stumpff_param)
+
+            assert np.isfinite(gradient)
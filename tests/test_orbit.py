@@ -0,0 +1,21 @@
+import numpy as np
+
+from hohmannpy.astro import Orbit
+
+
+def test_equatorial_orbit_raan_is_zero():
+    # h = r x v has an exactly zero 1- and 2-component for a state in the equatorial plane.
+    orbit = Orbit.from_state(np.array([7e6, 0.0, 0.0]), np.array([0.0, 8e3, 0.0]))
+
+    assert orbit.raan == 0
+    assert orbit.inclination == 0
+    assert np.isclose(orbit.true_latitude, orbit.argp + orbit.true_anomaly)
+
+
+def test_parabolic_orbit_sm_axis_is_inf():
+    # v^2 = 2 mu / r exactly, so the eccentricity comes out as exactly 1.
+    with np.errstate(divide="ignore"):
+        orbit = Orbit.from_state(np.array([2.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), grav_param=1.0)
+
+    assert orbit.eccentricity == 1
+    assert np.isinf(orbit.sm_axis)